@@ -1,13 +1,130 @@
 from setuptools import setup, Extension, find_packages
 from setuptools.command.build_ext import build_ext as build_ext_orig
+from setuptools.errors import CompileError, LinkError
+from concurrent.futures import ThreadPoolExecutor
+import tempfile
+import shutil
 import unittest
+import sys
+import os
 
 class build_ext(build_ext_orig):
+    def check_code(self, code, compile_flags=(), link_flags=(), libraries=()):
+        # Try to compile and link a program with the given flags and libraries
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            source = os.path.join(tmp_dir, 'check_code.c')
+            with open(source, 'w') as file:
+                file.write(code)
+            
+            try:
+                objects = self.compiler.compile([source], output_dir=tmp_dir, extra_postargs=list(compile_flags))
+                self.compiler.link_executable(objects, 'check_code', output_dir=tmp_dir, libraries=list(libraries), extra_postargs=list(link_flags))
+            except (CompileError, LinkError):
+                return False
+        
+        return True
+    
+    def check_flags(self, compile_flags, link_flags=()):
+        # Try to compile and link an empty program with the given flags
+        return self.check_code('int main(void) { return 0; }\n', compile_flags, link_flags)
+    
+    def configure_membridge(self, ext):
+        # Check which shared memory features are available, and return whether membridge can be built
+        shm_code = (
+            '#include <fcntl.h>\n'
+            '#include <sys/mman.h>\n'
+            'int main(void) { return shm_open("/sysframe-check", O_RDONLY, 0) == -1 && mmap(0, 0, PROT_READ, MAP_SHARED, -1, 0) == MAP_FAILED; }\n'
+        )
+        
+        # Older glibc versions keep `shm_open` in librt
+        if not self.check_code(shm_code):
+            if not self.check_code(shm_code, libraries=['rt']):
+                return False
+            ext.libraries.append('rt')
+        
+        if self.check_code('#include <sys/mman.h>\nint main(void) { return MAP_POPULATE; }\n'):
+            ext.define_macros.append(('HAVE_MAP_POPULATE', '1'))
+        
+        return True
+    
+    def parallel_compile(self, sources, output_dir=None, macros=None, include_dirs=None, debug=0, extra_preargs=None, extra_postargs=None, depends=None):
+        # Same as `CCompiler.compile`, except the source files are compiled simultaneously
+        compiler = self.compiler
+        macros, objects, extra_postargs, pp_opts, build = compiler._setup_compile(output_dir, macros, include_dirs, sources, depends, extra_postargs)
+        cc_args = compiler._get_cc_args(pp_opts, debug, extra_preargs)
+        
+        def compile_object(obj):
+            if obj in build:
+                src, ext = build[obj]
+                compiler._compile(obj, src, ext, cc_args, extra_postargs, pp_opts)
+        
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            # Consume the results to raise any compile errors
+            list(executor.map(compile_object, objects))
+        
+        return objects
+    
     def build_extensions(self):
         ct = self.compiler.compiler_type
         if ct == 'unix':
+            compile_args = ['-O3']
+            link_args = []
+            
+            # Link-time optimization lets the SBS helpers be inlined across the source files
+            if self.check_flags(['-flto'], ['-flto']):
+                compile_args += ['-flto']
+                link_args += ['-flto']
+            
+            # Call the functions shared between the source files directly instead of through the PLT
+            for flag in ('-fno-plt', '-fno-semantic-interposition'):
+                if self.check_flags([flag]):
+                    compile_args += [flag]
+            
+            # Tune for the given CPU architecture, unless we're building portable wheels
+            is_wheel_build = os.environ.get('CIBUILDWHEEL') or 'bdist_wheel' in sys.argv
+            march = os.environ.get('SYSFRAME_MARCH', '' if is_wheel_build else 'native')
+            if march and self.check_flags([f'-march={march}']):
+                compile_args += [f'-march={march}']
+                
+                # Architecture levels like `x86-64-v3` are no valid tuning targets
+                if self.check_flags([f'-mtune={march}']):
+                    compile_args += [f'-mtune={march}']
+            elif march and 'SYSFRAME_MARCH' in os.environ:
+                self.warn(f"The compiler doesn't support '-march={march}', building without it")
+            
+            # Older Python versions don't mark the module init function as exported
+            if sys.version_info >= (3, 9):
+                compile_args += ['-fvisibility=hidden']
+            
             for ext in self.extensions:
-                ext.extra_compile_args = ['-O3']
+                ext.extra_compile_args = compile_args
+                ext.extra_link_args = link_args
+            
+            # Membridge requires POSIX shared memory that can grow, which macOS doesn't allow after its first resize
+            for ext in list(self.extensions):
+                if ext.name != 'sysframe.membridge.membridge':
+                    continue
+                elif sys.platform == 'darwin':
+                    self.warn("macOS can't grow shared memory, skipping 'sysframe.membridge'")
+                    self.extensions.remove(ext)
+                elif not self.configure_membridge(ext):
+                    self.warn("POSIX shared memory is not available, skipping 'sysframe.membridge'")
+                    self.extensions.remove(ext)
+            
+            # Compile through ccache when available to speed up rebuilds
+            if shutil.which('ccache') and not os.environ.get('SYSFRAME_NO_CCACHE'):
+                os.environ.setdefault('CCACHE_COMPILERCHECK', 'content')
+                if self.compiler.compiler_so[0] != 'ccache':
+                    self.compiler.compiler_so = ['ccache'] + self.compiler.compiler_so
+                    self.compiler.compiler = ['ccache'] + self.compiler.compiler
+            
+            # Compile the sources of each extension in parallel, unless a job count was given
+            if self.parallel is None:
+                self.compiler.compile = self.parallel_compile
+        elif ct == 'msvc':
+            for ext in self.extensions:
+                ext.extra_compile_args = ['/GL']
+                ext.extra_link_args = ['/LTCG']
         super().build_extensions()
 
 with open("README.md", "r") as file:
@@ -31,6 +148,10 @@ setup(
     include_package_data=True,
     install_requires=[],
     
+    # Environment variables for the extension builds:
+    # - `SYSFRAME_MARCH`: The CPU architecture to compile for (`-march`/`-mtune`). Defaults to `native`
+    #   for local builds and to none for wheel builds. Set it to an empty string to disable it.
+    # - `SYSFRAME_NO_CCACHE`: Don't compile through `ccache`, even if it's installed.
     ext_modules=[
         Extension( # Pybytes
             
@@ -44,6 +165,7 @@ setup(
                 'sysframe/pybytes',
             ]
         ),
+    ] + ([] if sys.platform == 'win32' else [ # Membridge relies on POSIX shared memory, which Windows doesn't have
         Extension( # membridge
         
             'sysframe.membridge.membridge',
@@ -57,7 +179,7 @@ setup(
                 'sysframe/pybytes',
             ]
         )
-    ],
+    ]),
     package_data={
         '': ['*.pyi']
     },
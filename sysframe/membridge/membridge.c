@@ -3,6 +3,7 @@
 #include <pthread.h>
 #include <fcntl.h>
 #include <sys/mman.h>
+#include <sys/stat.h>
 #include <unistd.h>
 #include <stdlib.h>
 #include <stdio.h>
@@ -15,11 +16,20 @@
 // Include the serialization function from pybytes (from_value, to_value)
 #include "sbs_main/sbs_2.h"
 
-// Struct for basic shared memory
+// The cache line size, to which the start of the stored value is aligned
+#define CACHE_LINE 64
+
+// Marks shared memory created with the current layout of the basic struct, change it whenever the layout changes
+#define SHM_MAGIC 0x4d425333 // 'MBS3'
+
+// Struct for basic shared memory, padded to a full cache line
 typedef struct {
+    uint32_t magic;
+    int removed; // Set when the shared memory is removed, so that processes drop their cached mapping of it
     size_t max_size;
+    size_t size; // The size of the value written last, which is all that's copied when reading
     pthread_mutex_t mutex;
-} BasicShm;
+} __attribute__((aligned(CACHE_LINE))) BasicShm;
 
 // The default size for basic shared memory
 #define BASIC_SIZE sizeof(BasicShm)
@@ -27,6 +37,40 @@ typedef struct {
 // The headroom size for not too frequent reallocs
 #define HEAD_SIZE 32
 
+// The size from which we advise the kernel to use huge pages
+#define HUGEPAGE_SIZE (2 * 1024 * 1024)
+
+// Pre-fault the pages when mapping, if supported
+#ifdef HAVE_MAP_POPULATE
+#define MAP_FLAGS (MAP_SHARED | MAP_POPULATE)
+#else
+#define MAP_FLAGS MAP_SHARED
+#endif
+
+// The page size of the system, set on module init
+static size_t page_size = 4096;
+
+// Helper function to round a shared memory size up to a multiple of the page size
+static inline size_t page_align(size_t size)
+{
+    return (size + page_size - 1) & ~(page_size - 1);
+}
+
+// Struct for a shared memory mapping cached by this process
+typedef struct {
+    BasicShm *shm;
+    size_t size; // The total mapped size, including the basic struct
+} MappedShm;
+
+// The name used for the capsules holding the cached mappings
+#define MAPPED_SHM_NAME "membridge.MappedShm"
+
+// Dict holding the cached mappings of this process, by shared memory name
+static PyObject *mapped_memory = NULL;
+
+// The mmap class, used for exposing shared memory as a buffer
+static PyObject *mmap_cl = NULL;
+
 // # Shared memory creation & setup
 
 static inline int create_shared_memory(const char *name, size_t pre_size, PyObject *error_if_exists)
@@ -43,7 +87,10 @@ static inline int create_shared_memory(const char *name, size_t pre_size, PyObje
         return 1;
     }
 
-    if (ftruncate(fd, BASIC_SIZE + pre_size) == -1)
+    // Use all space of the pages we allocate
+    size_t total_size = page_align(BASIC_SIZE + pre_size);
+
+    if (ftruncate(fd, total_size) == -1)
     {
         close(fd);
         shm_unlink(name);
@@ -73,7 +120,8 @@ static inline int create_shared_memory(const char *name, size_t pre_size, PyObje
         return -1;
     }
 
-    shm->max_size = pre_size;
+    shm->max_size = total_size - BASIC_SIZE;
+    shm->magic = SHM_MAGIC;
     pthread_mutexattr_destroy(&attr);
     munmap(shm, BASIC_SIZE);
     close(fd);
@@ -82,7 +130,10 @@ static inline int create_shared_memory(const char *name, size_t pre_size, PyObje
     return 0;
 }
 
-PyObject *create_memory(PyObject *self, PyObject *args, PyObject *kwargs)
+// Pre-definition for getting the cached mapping of a shared memory
+static MappedShm *get_mapped_shm(const char *name, size_t new_size, PyObject *create);
+
+static PyObject *create_memory(PyObject *self, PyObject *args, PyObject *kwargs)
 {
     const char *name;
     PyObject *prealloc_size = NULL;
@@ -111,8 +162,13 @@ PyObject *create_memory(PyObject *self, PyObject *args, PyObject *kwargs)
     switch(result)
     {
     case -1: return NULL; // Error already set
-    case 0:  return Py_True;
-    case 1:  return Py_False;
+    case 0:
+    {
+        // Map the shared memory right away so that later reads and writes can use the cached mapping
+        if (get_mapped_shm(name, 0, Py_False) == NULL) return NULL;
+        Py_RETURN_TRUE;
+    }
+    case 1:  Py_RETURN_FALSE;
     default:
     {
         PyErr_SetString(PyExc_RuntimeError, "Something went wrong, but we couldn't quite catch what it was.");
@@ -121,8 +177,34 @@ PyObject *create_memory(PyObject *self, PyObject *args, PyObject *kwargs)
     }
 }
 
-// Helper function to get the basic shared memory pointer
-static inline BasicShm *get_basic_shm(const char *name, size_t new_size, PyObject *create)
+// Helper function to check whether an opened shared memory has the layout of this version, sets an error if not
+static inline int check_basic_shm(int fd, const char *name, size_t *file_size)
+{
+    // Get the actual size of the shared memory, as the size in the basic struct can't be trusted beyond it
+    struct stat st;
+    if (fstat(fd, &st) == -1)
+    {
+        PyErr_Format(PyExc_MemoryError, "Failed to get the size of shared memory address '%s'.", name);
+        return -1;
+    }
+
+    *file_size = (size_t)st.st_size;
+
+    // Map the basic struct to check its magic and max size
+    BasicShm *shm = *file_size >= BASIC_SIZE ? mmap(NULL, BASIC_SIZE, PROT_READ, MAP_SHARED, fd, 0) : MAP_FAILED;
+    if (shm == MAP_FAILED || shm->magic != SHM_MAGIC || BASIC_SIZE + shm->max_size > *file_size)
+    {
+        if (shm != MAP_FAILED) munmap(shm, BASIC_SIZE);
+        PyErr_Format(PyExc_MemoryError, "The shared memory address '%s' was not created by this version of membridge.", name);
+        return -1;
+    }
+
+    munmap(shm, BASIC_SIZE);
+    return 0;
+}
+
+// Helper function to get the basic shared memory pointer, and the total size that is mapped
+static inline BasicShm *get_basic_shm(const char *name, size_t new_size, PyObject *create, size_t *mapped_size)
 {
     int fd = shm_open(name, O_RDWR, 0666);
     if (fd == -1)
@@ -145,27 +227,21 @@ static inline BasicShm *get_basic_shm(const char *name, size_t new_size, PyObjec
         }
     }
 
-    // Map the basic structure first to access max_size
-    BasicShm *shm = mmap(NULL, BASIC_SIZE, PROT_READ | PROT_WRITE, MAP_SHARED, fd, 0);
-    if (shm == MAP_FAILED)
+    // Check the layout, and get the size to map
+    size_t total_size;
+    if (check_basic_shm(fd, name, &total_size) == -1)
     {
         close(fd);
-        PyErr_Format(PyExc_MemoryError, "Failed to map shared memory metadata address '%s'.", name);
         return NULL;
     }
 
-    // Get the max size from the basic structure
-    size_t max_size = shm->max_size;
-    size_t total_size = BASIC_SIZE + max_size;
-    
-    // Unmap the initial mapping to remap the full size
-    munmap(shm, BASIC_SIZE);
+    size_t max_size = total_size - BASIC_SIZE;
 
     // Check whether we got a new size we might need to update
     if (new_size > max_size)
     {
-        // Update the new total size
-        total_size = BASIC_SIZE + new_size + HEAD_SIZE;
+        // Update the new total size, using all space of the pages we allocate
+        total_size = page_align(BASIC_SIZE + new_size + HEAD_SIZE);
 
         if (ftruncate(fd, total_size) == -1)
         {
@@ -175,8 +251,8 @@ static inline BasicShm *get_basic_shm(const char *name, size_t new_size, PyObjec
         }
     }
 
-    // Remap with the correct size
-    shm = mmap(NULL, total_size, PROT_READ | PROT_WRITE, MAP_SHARED, fd, 0);
+    // Map the full size
+    BasicShm *shm = mmap(NULL, total_size, PROT_READ | PROT_WRITE, MAP_FLAGS, fd, 0);
     if (shm == MAP_FAILED)
     {
         close(fd);
@@ -184,22 +260,120 @@ static inline BasicShm *get_basic_shm(const char *name, size_t new_size, PyObjec
         return NULL;
     }
 
+#ifdef MADV_HUGEPAGE
+    // Large values benefit from fewer TLB entries, so use huge pages when available
+    if (total_size >= HUGEPAGE_SIZE)
+        madvise(shm, total_size, MADV_HUGEPAGE);
+#endif
+
     // Update the max size if it was changed
     if (shm->max_size < new_size)
-        shm->max_size = new_size + HEAD_SIZE;
+        shm->max_size = total_size - BASIC_SIZE;
 
     close(fd);
+    *mapped_size = total_size;
     return shm;
 }
 
-// Function to close a shared memory pointer
-static inline void close_shm(BasicShm *shm)
+// Destructor for the capsules holding the cached mappings
+static void mapped_shm_destructor(PyObject *capsule)
 {
-    pthread_mutex_unlock(&(shm->mutex));
-    munmap(shm, BASIC_SIZE + shm->max_size);
+    MappedShm *mapped = (MappedShm *)PyCapsule_GetPointer(capsule, MAPPED_SHM_NAME);
+
+    munmap(mapped->shm, mapped->size);
+    free(mapped);
+}
+
+// Helper function to get the cached mapping of a shared memory, only (re)mapping it when necessary
+static MappedShm *get_mapped_shm(const char *name, size_t new_size, PyObject *create)
+{
+    /*
+      Opening and mapping the shared memory takes multiple syscalls, so the
+      mapping is kept for as long as this process uses the shared memory.
+      The cached mapping is only replaced when the shared memory has to be
+      resized, when another process has resized it in the meantime, or when
+      it was removed, as the name might point to a new shared memory by now.
+
+    */
+
+    PyObject *capsule = PyDict_GetItemString(mapped_memory, name);
+    if (capsule != NULL)
+    {
+        MappedShm *mapped = (MappedShm *)PyCapsule_GetPointer(capsule, MAPPED_SHM_NAME);
+
+        // Use the cached mapping if it's not removed and covers both the current and the requested size
+        size_t max_size = mapped->shm->max_size;
+        if (!__atomic_load_n(&(mapped->shm->removed), __ATOMIC_ACQUIRE) && new_size <= max_size && BASIC_SIZE + max_size <= mapped->size)
+            return mapped;
+
+        // Remove the outdated mapping, which is unmapped by the capsule destructor
+        if (PyDict_DelItemString(mapped_memory, name) == -1) return NULL;
+    }
+
+    size_t mapped_size;
+    BasicShm *shm = get_basic_shm(name, new_size, create, &mapped_size);
+    if (shm == NULL) return NULL; // Error already set
+
+    MappedShm *mapped = (MappedShm *)malloc(sizeof(MappedShm));
+    if (mapped == NULL)
+    {
+        munmap(shm, mapped_size);
+        PyErr_SetString(PyExc_MemoryError, "Not enough memory space available for use.");
+        return NULL;
+    }
+
+    mapped->shm = shm;
+    mapped->size = mapped_size;
+
+    // Cache the mapping in a capsule, which takes care of unmapping it
+    capsule = PyCapsule_New(mapped, MAPPED_SHM_NAME, mapped_shm_destructor);
+    if (capsule == NULL)
+    {
+        munmap(shm, mapped->size);
+        free(mapped);
+        return NULL;
+    }
+
+    int result = PyDict_SetItemString(mapped_memory, name, capsule);
+    Py_DECREF(capsule);
+    if (result == -1) return NULL;
+
+    return mapped;
+}
+
+// Helper function to get the cached mapping of a shared memory with its mutex locked
+static MappedShm *get_locked_shm(const char *name, size_t new_size, PyObject *create, PyObject **capsule)
+{
+    /*
+      The capsule holding the mapping is returned as a new reference, which the
+      caller releases after unlocking. This keeps the mapping alive when another
+      thread replaces the cached mapping while this one is waiting for the lock.
+
+    */
+
+    while (1)
+    {
+        MappedShm *mapped = get_mapped_shm(name, new_size, create);
+        if (mapped == NULL) return NULL; // Error already set
+
+        *capsule = PyDict_GetItemString(mapped_memory, name);
+        Py_INCREF(*capsule);
+
+        // Wait for the lock without holding the GIL, as the thread holding the lock might be waiting for the GIL
+        Py_BEGIN_ALLOW_THREADS
+        pthread_mutex_lock(&(mapped->shm->mutex));
+        Py_END_ALLOW_THREADS
+
+        // Make sure another process didn't resize or remove the memory before we got the lock
+        if (!__atomic_load_n(&(mapped->shm->removed), __ATOMIC_ACQUIRE) && BASIC_SIZE + mapped->shm->max_size <= mapped->size)
+            return mapped;
+
+        pthread_mutex_unlock(&(mapped->shm->mutex));
+        Py_DECREF(*capsule);
+    }
 }
 
-PyObject *remove_memory(PyObject *self, PyObject *args, PyObject *kwargs)
+static PyObject *remove_memory(PyObject *self, PyObject *args, PyObject *kwargs)
 {
     const char *name;
     PyObject *throw_error = NULL;
@@ -212,6 +386,32 @@ PyObject *remove_memory(PyObject *self, PyObject *args, PyObject *kwargs)
         return NULL;
     }
 
+    // Drop the cached mapping of this process
+    if (PyDict_GetItemString(mapped_memory, name) != NULL && PyDict_DelItemString(mapped_memory, name) == -1)
+        return NULL;
+
+    // Mark the shared memory as removed, so that other processes drop their cached mappings too
+    int fd = shm_open(name, O_RDWR, 0666);
+    size_t file_size;
+    if (fd != -1 && check_basic_shm(fd, name, &file_size) == -1)
+    {
+        // Still remove shared memory of other versions, it just doesn't have the flag to set
+        PyErr_Clear();
+        close(fd);
+    }
+    else if (fd != -1)
+    {
+        BasicShm *shm = mmap(NULL, BASIC_SIZE, PROT_READ | PROT_WRITE, MAP_SHARED, fd, 0);
+        close(fd);
+
+        if (shm != MAP_FAILED)
+        {
+            // Set it without locking, as removing should work even if a crashed process left the mutex locked
+            __atomic_store_n(&(shm->removed), 1, __ATOMIC_RELEASE);
+            munmap(shm, BASIC_SIZE);
+        }
+    }
+
     if (shm_unlink(name) == -1)
     {
         if (throw_error && Py_IsTrue(throw_error))
@@ -225,7 +425,7 @@ PyObject *remove_memory(PyObject *self, PyObject *args, PyObject *kwargs)
     Py_RETURN_TRUE;
 }
 
-PyObject *read_memory(PyObject *self, PyObject *args)
+static PyObject *read_memory(PyObject *self, PyObject *args)
 {
     const char *name;
 
@@ -235,25 +435,42 @@ PyObject *read_memory(PyObject *self, PyObject *args)
         return NULL;
     }
 
-    BasicShm *shm = get_basic_shm(name, 0, Py_None);
-    if (shm == NULL) return NULL;  // Error already set
+    PyObject *capsule;
+    MappedShm *mapped = get_locked_shm(name, 0, Py_None, &capsule);
+    if (mapped == NULL) return NULL;  // Error already set
+
+    const char *payload = (const char *)mapped->shm + BASIC_SIZE;
+    size_t size = mapped->shm->size;
+    if (size > mapped->shm->max_size) size = mapped->shm->max_size;
 
-    if (shm->max_size == 0)
+    // Check whether a value has been written yet
+    if (size == 0)
     {
-        close_shm(shm);
+        pthread_mutex_unlock(&(mapped->shm->mutex));
+        Py_DECREF(capsule);
         Py_RETURN_NONE;
     }
 
-    PyObject *py_bytes = PyBytes_FromStringAndSize((char *)shm + BASIC_SIZE, shm->max_size);
-    PyObject *value = to_value(py_bytes);
+    /*
+      Copy the value out of the shared memory and convert it after unlocking.
+      Converting can run Python code that releases the GIL, which would deadlock
+      with another thread that holds the GIL while waiting for this lock.
 
+    */
+
+    PyObject *py_bytes = PyBytes_FromStringAndSize(payload, size);
+    pthread_mutex_unlock(&(mapped->shm->mutex));
+    Py_DECREF(capsule);
+
+    if (py_bytes == NULL) return NULL;
+
+    PyObject *value = to_value_buffer((const unsigned char *)PyBytes_AS_STRING(py_bytes), size);
     Py_DECREF(py_bytes);
-    close_shm(shm);
 
     return value;
 }
 
-PyObject *write_memory(PyObject *self, PyObject *args, PyObject *kwargs)
+static PyObject *write_memory(PyObject *self, PyObject *args, PyObject *kwargs)
 {
     const char *name;
     PyObject *value;
@@ -280,16 +497,144 @@ PyObject *write_memory(PyObject *self, PyObject *args, PyObject *kwargs)
         PyErr_SetString(PyExc_RuntimeError, "Failed to convert a Python bytes object to a C string.");
         return NULL;
     }
-    Py_DECREF(py_bytes);
 
-    BasicShm *shm = get_basic_shm(name, size, create);
-    if (shm == NULL) return NULL;
+    PyObject *capsule;
+    MappedShm *mapped = get_locked_shm(name, size, create, &capsule);
+    if (mapped == NULL)
+    {
+        Py_DECREF(py_bytes);
+        return NULL;
+    }
 
-    memcpy((char *)shm + BASIC_SIZE, bytes, size);
-    close_shm(shm);
+    memcpy((char *)mapped->shm + BASIC_SIZE, bytes, size);
+    mapped->shm->size = size;
+    pthread_mutex_unlock(&(mapped->shm->mutex));
+    Py_DECREF(capsule);
+
+    Py_DECREF(py_bytes);
     Py_RETURN_TRUE;
 }
 
+static PyObject *map_memory(PyObject *self, PyObject *args, PyObject *kwargs)
+{
+    const char *name;
+    PyObject *py_size = NULL;
+    PyObject *create = NULL;
+
+    static char* kwlist[] = {"name", "size", "create", NULL};
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "s|O!O!", kwlist, &name, &PyLong_Type, &py_size, &PyBool_Type, &create))
+    {
+        PyErr_SetString(PyExc_ValueError, "Expected at least the 'name' (str) argument.");
+        return NULL;
+    }
+
+    size_t size = 0;
+    if (py_size != NULL)
+    {
+        size = PyLong_AsSize_t(py_size);
+        if (size == (size_t)-1 && PyErr_Occurred())
+        {
+            PyErr_SetString(PyExc_ValueError, "The given size is too large.");
+            return NULL;
+        }
+    }
+
+    // Make sure the shared memory exists and is large enough
+    MappedShm *mapped = get_mapped_shm(name, size, create);
+    if (mapped == NULL) return NULL; // Error already set
+
+    int fd = shm_open(name, O_RDWR, 0666);
+    if (fd == -1)
+    {
+        PyErr_Format(PyExc_MemoryError, "Failed to open shared memory address '%s'.", name);
+        return NULL;
+    }
+
+    // Map the memory with an mmap object, so that the mapping lives as long as the buffers using it
+    PyObject *mmap_obj = PyObject_CallFunction(mmap_cl, "in", fd, (Py_ssize_t)mapped->size);
+    close(fd);
+    if (mmap_obj == NULL) return NULL;
+
+    PyObject *memoryview = PyMemoryView_FromObject(mmap_obj);
+    Py_DECREF(mmap_obj);
+    if (memoryview == NULL) return NULL;
+
+    // Only expose the part of the memory that holds the value
+    PyObject *value_view = PySequence_GetSlice(memoryview, BASIC_SIZE, mapped->size);
+    Py_DECREF(memoryview);
+
+    return value_view;
+}
+
+static PyObject *write_into(PyObject *self, PyObject *args)
+{
+    PyObject *buffer;
+    PyObject *value;
+
+    if (!PyArg_ParseTuple(args, "OO", &buffer, &value))
+    {
+        PyErr_SetString(PyExc_ValueError, "Expected a 'buffer' and 'any' type.");
+        return NULL;
+    }
+
+    Py_buffer view;
+    if (PyObject_GetBuffer(buffer, &view, PyBUF_WRITABLE) == -1)
+    {
+        PyErr_SetString(PyExc_ValueError, "Expected a writable buffer, such as one from 'map_memory'.");
+        return NULL;
+    }
+
+    // Convert the value to a Python bytes object
+    PyObject *py_bytes = from_value(value);
+    if (py_bytes == NULL)
+    {
+        PyBuffer_Release(&view);
+        return NULL; // Error already set
+    }
+
+    Py_ssize_t size = PyBytes_GET_SIZE(py_bytes);
+    if (size > view.len)
+    {
+        Py_DECREF(py_bytes);
+        PyBuffer_Release(&view);
+        PyErr_SetString(PyExc_ValueError, "The value is too large for the given buffer.");
+        return NULL;
+    }
+
+    memcpy(view.buf, PyBytes_AS_STRING(py_bytes), size);
+
+    Py_DECREF(py_bytes);
+    PyBuffer_Release(&view);
+
+    // Return the number of bytes written
+    return PyLong_FromSsize_t(size);
+}
+
+static PyObject *read_from(PyObject *self, PyObject *args)
+{
+    PyObject *buffer;
+
+    if (!PyArg_ParseTuple(args, "O", &buffer))
+    {
+        PyErr_SetString(PyExc_ValueError, "Expected 1 'buffer' type.");
+        return NULL;
+    }
+
+    Py_buffer view;
+    if (PyObject_GetBuffer(buffer, &view, PyBUF_SIMPLE) == -1)
+    {
+        PyErr_SetString(PyExc_ValueError, "Expected a buffer, such as one from 'map_memory'.");
+        return NULL;
+    }
+
+    // Convert the value directly from the buffer
+    PyObject *value = to_value_buffer((const unsigned char *)view.buf, (size_t)view.len);
+    PyBuffer_Release(&view);
+
+    return value;
+}
+
 // # Shared functions
 
 typedef struct {
@@ -462,7 +807,7 @@ static inline PyObject *create_shared_function(const char *name, PyObject *func)
     return exit_status == 1 ? NULL : Py_None;
 }
 
-PyObject *create_function(PyObject *self, PyObject *args)
+static PyObject *create_function(PyObject *self, PyObject *args)
 {
     const char *name;
     PyObject *func;
@@ -488,7 +833,7 @@ PyObject *create_function(PyObject *self, PyObject *args)
 }
 
 // Call a function linked to a shared memory conditional
-PyObject *call_shared_function(const char *name, PyObject *args)
+static PyObject *call_shared_function(const char *name, PyObject *args)
 {
     int fd = shm_open(name, O_RDWR, 0666);
     if (fd == -1)
@@ -573,7 +918,7 @@ PyObject *call_shared_function(const char *name, PyObject *args)
     return returned_value;
 }
 
-PyObject *call_function(PyObject *self, PyObject *args)
+static PyObject *call_function(PyObject *self, PyObject *args)
 {
     const char *name;
     PyObject *py_args;
@@ -593,7 +938,7 @@ PyObject *call_function(PyObject *self, PyObject *args)
     return return_value;
 }
 
-PyObject *remove_function(PyObject *self, PyObject *args)
+static PyObject *remove_function(PyObject *self, PyObject *args)
 {
     const char *name;
 
@@ -627,6 +972,9 @@ static PyMethodDef methods[] = {
     {"remove_memory", (PyCFunction)remove_memory, METH_VARARGS | METH_KEYWORDS, "Remove a shared memory address."},
     {"read_memory", read_memory, METH_VARARGS, "Get the value stored in a shared memory address."},
     {"write_memory", (PyCFunction)write_memory, METH_VARARGS | METH_KEYWORDS, "Write a value to a shared memory address."},
+    {"map_memory", (PyCFunction)map_memory, METH_VARARGS | METH_KEYWORDS, "Get a writable buffer of a shared memory address."},
+    {"write_into", write_into, METH_VARARGS, "Write a value into a buffer."},
+    {"read_from", read_from, METH_VARARGS, "Get the value stored in a buffer."},
 
     {"create_function", create_function, METH_VARARGS, "Create and link a function to shared memory."},
     {"remove_function", remove_function, METH_VARARGS, "Stop a function linked to shared memory."},
@@ -635,8 +983,10 @@ static PyMethodDef methods[] = {
     {NULL, NULL, 0, NULL}
 };
 
-void membridge_module_cleanup(void *module)
+static void membridge_module_cleanup(void *module)
 {
+    Py_CLEAR(mapped_memory);
+    Py_CLEAR(mmap_cl);
     sbs2_cleanup();
     Py_Finalize();
 }
@@ -655,6 +1005,33 @@ PyMODINIT_FUNC PyInit_membridge(void)
 {
     sbs2_init();
     Py_Initialize();
+
+    // Get the page size to align the shared memory sizes to
+    long sys_page_size = sysconf(_SC_PAGESIZE);
+    if (sys_page_size > 0)
+        page_size = (size_t)sys_page_size;
+
+    // Create the dict for the cached mappings
+    mapped_memory = PyDict_New();
+    if (mapped_memory == NULL) return NULL;
+
+    // Get the mmap class
+    PyObject *mmap_m = PyImport_ImportModule("mmap");
+    if (mmap_m == NULL)
+    {
+        PyErr_SetString(PyExc_ModuleNotFoundError, "Could not find module 'mmap'.");
+        return NULL;
+    }
+
+    mmap_cl = PyObject_GetAttrString(mmap_m, "mmap");
+    Py_DECREF(mmap_m);
+
+    if (mmap_cl == NULL)
+    {
+        PyErr_SetString(PyExc_AttributeError, "Could not find attribute 'mmap' in module 'mmap'.");
+        return NULL;
+    }
+
     return PyModule_Create(&membridge);
 }
 
@@ -55,6 +55,46 @@ def write_memory(name: str, value: any, create: bool=True) -> bool:
     """
     ...
 
+def map_memory(name: str, size: int=None, create: bool=True) -> memoryview:
+    """
+    Get a writable buffer of a shared memory segment.
+    
+    Arguments:
+    - `name`: The unique name for your shared memory to map.
+    - `size`: The minimum size the buffer should have (optional).
+    - `create`: Create the shared memory if it doesn't exist yet (optional).
+    
+    Use `write_into` and `read_from` with the returned buffer to write and read values without opening the shared memory on each call.
+    These don't lock the shared memory, so synchronizing access between processes is up to you.
+    The buffer keeps its size, even when the shared memory is resized afterwards.
+    Values written into the buffer are read back with `read_from`, as `read_memory` only reads the values written by `write_memory`.
+    
+    """
+    ...
+
+def write_into(buffer: memoryview, value: any) -> int:
+    """
+    Write a value into a buffer, such as one from `map_memory`.
+    
+    Arguments:
+    - `buffer`: The writable buffer to write the value into.
+    - `value`: The value you want to write to the buffer.
+    
+    This will return the number of bytes written, and throw an error if the value does not fit in the buffer.
+    
+    """
+    ...
+
+def read_from(buffer: memoryview) -> any:
+    """
+    Read the value stored in a buffer, such as one from `map_memory`.
+    
+    Arguments:
+    - `buffer`: The buffer to read the value from.
+    
+    """
+    ...
+
 def create_function(name: str, function: callable) -> None:
     """
     Create and link a function to shared memory.
@@ -2,43 +2,72 @@
 
 // # The python handles for from and to value calls
 
-static PyObject *py_from_value(PyObject *self, PyObject *args)
+static PyObject *py_from_value(PyObject *self, PyObject *value)
 {
-    PyObject *value;
+    // Call the imported from_value converter function
+    return from_value(value);
+}
 
-    // Parse the args and kwargs
-    if (!PyArg_ParseTuple(args, "O", &value))
+// Take the arguments directly, as parsing them would take longer than writing a small value
+#if PY_VERSION_HEX >= 0x03070000
+#define FROM_VALUE_INTO_FLAGS METH_FASTCALL
+static PyObject *py_from_value_into(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+#else
+#define FROM_VALUE_INTO_FLAGS METH_VARARGS
+static PyObject *py_from_value_into(PyObject *self, PyObject *args_tuple)
+{
+    PyObject *const *args = &PyTuple_GET_ITEM(args_tuple, 0);
+    Py_ssize_t nargs = PyTuple_GET_SIZE(args_tuple);
+#endif
+    if (nargs != 2 || !PyByteArray_Check(args[0]))
     {
-        PyErr_SetString(PyExc_ValueError, "Expected 1 'any' argument.");
+        PyErr_SetString(PyExc_ValueError, "Expected a 'bytearray' and 'any' type.");
         return NULL;
     }
 
-    Py_INCREF(value);
+    // Write the value into the bytearray
+    Py_ssize_t size = from_value_into(args[0], args[1]);
+    if (size == -1) return NULL; // Error already set
 
-    // Call the imported from_value converter function
-    PyObject *bytes = from_value(value);
-
-    // Clean up reference
-    Py_DECREF(value);
-
-    return bytes;
+    return PyLong_FromSsize_t(size);
 }
 
-static PyObject *py_to_value(PyObject *self, PyObject *args)
+static PyObject *py_from_values(PyObject *self, PyObject *iterable)
 {
-    PyObject *py_bytes = NULL;
+    // Call the imported from_values converter function
+    return from_values(iterable);
+}
 
-    if (!PyArg_ParseTuple(args, "O!", &PyBytes_Type, &py_bytes))
+static PyObject *py_to_value(PyObject *self, PyObject *bytes_obj)
+{
+    // Get the buffer of the bytes-like object, so that we can read it without copying
+    Py_buffer view;
+    if (PyObject_GetBuffer(bytes_obj, &view, PyBUF_SIMPLE) == -1)
     {
         PyErr_SetString(PyExc_ValueError, "Expected 1 'bytes' type.");
         return NULL;
     }
 
-    Py_INCREF(py_bytes);
+    PyObject *result = to_value_buffer((const unsigned char *)view.buf, (size_t)view.len);
+
+    PyBuffer_Release(&view);
+    return result;
+}
+
+static PyObject *py_to_values(PyObject *self, PyObject *bytes_obj)
+{
+    // Get the buffer of the bytes-like object, so that we can read it without copying
+    Py_buffer view;
+    if (PyObject_GetBuffer(bytes_obj, &view, PyBUF_SIMPLE) == -1)
+    {
+        PyErr_SetString(PyExc_ValueError, "Expected 1 'bytes' type.");
+        return NULL;
+    }
 
-    PyObject *result = to_value(py_bytes);
+    PyObject *result = to_values_buffer((const unsigned char *)view.buf, (size_t)view.len);
 
-    Py_DECREF(py_bytes);
+    PyBuffer_Release(&view);
     return result;
 }
 
@@ -46,14 +75,17 @@ static PyObject *py_to_value(PyObject *self, PyObject *args)
 
 // The offered methods and their descriptions
 static PyMethodDef methods[] = {
-    {"from_value", py_from_value, METH_VARARGS, "Convert a value to a bytes object."},
-    {"to_value", py_to_value, METH_VARARGS, "Convert a bytes object to a value."},
+    {"from_value", py_from_value, METH_O, "Convert a value to a bytes object."},
+    {"from_value_into", (PyCFunction)(void (*)(void))py_from_value_into, FROM_VALUE_INTO_FLAGS, "Convert a value to bytes written into a bytearray."},
+    {"from_values", py_from_values, METH_O, "Convert the items of an iterable to a bytes object."},
+    {"to_value", py_to_value, METH_O, "Convert a bytes object to a value."},
+    {"to_values", py_to_values, METH_O, "Convert a bytes object to a list of values."},
 
     {NULL, NULL, 0, NULL}
 };
 
 // Clean up on exit
-void pybytes_module_cleanup(void *module)
+static void pybytes_module_cleanup(void *module)
 {
     // Cleanup the SBS modules
     sbs2_cleanup();
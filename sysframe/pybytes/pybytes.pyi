@@ -40,10 +40,44 @@ def from_value(value: any) -> bytes:
     """
     ...
 
+def from_value_into(buffer: bytearray, value: any) -> int:
+    """
+    Convert any value to bytes, written into a bytearray.
+    
+    Example usage:
+    
+    >>> # A bytearray that we can reuse for converting multiple values
+    >>> buffer = bytearray(1024)
+    >>> # Write the value to the start of the buffer, and get the number of bytes written
+    >>> size = pybytes.from_value_into(buffer, 'Hello, world!')
+    
+    The bytearray is resized when the value does not fit in it.
+    Supports the same datatypes as `pybytes.from_value`, and the value can be converted back using `pybytes.to_value`.
+    """
+    ...
+
+def from_values(iterable: any) -> bytes:
+    """
+    Convert the items of an iterable to a bytes object.
+    
+    Example usage:
+    
+    >>> # The values we want to convert to bytes
+    >>> values = [3.142, 'Hello, world!', True]
+    >>> # Convert them to a single bytes object
+    >>> bytes_obj = pybytes.from_values(values)
+    
+    Unlike converting a list with `pybytes.from_value`, the items are not wrapped in a list.
+    Multiple of these bytes objects can be concatenated, and converted back at once using `pybytes.to_values`.
+    """
+    ...
+
 def to_value(bytes_obj: bytes) -> any:
     """
     Convert a bytes object created by `pybytes.from_value` back to its original value.
     
+    Any bytes-like object is accepted, such as a `bytearray` or `memoryview`, which are read without copying them.
+    
     Example usage:
     
     >>> # The bytes object we got from `pybytes.from_value`
@@ -53,3 +87,18 @@ def to_value(bytes_obj: bytes) -> any:
     """
     ...
 
+def to_values(bytes_obj: bytes) -> list:
+    """
+    Convert a bytes object created by `pybytes.from_values` back to a list of the original values.
+    
+    Concatenated bytes objects of `pybytes.from_values` are converted to a single list of all their values.
+    Any bytes-like object is accepted, such as a `bytearray` or `memoryview`, which are read without copying them.
+    
+    Example usage:
+    
+    >>> # The bytes objects we got from `pybytes.from_values`
+    >>> bytes_obj = b'...' + b'...'
+    >>> # Convert them back to a list of the original values
+    >>> values = pybytes.to_values(bytes_obj)
+    """
+    ...
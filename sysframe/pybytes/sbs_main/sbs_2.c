@@ -104,8 +104,9 @@
 #define EXT_M  255 // Reserved for if we ever happen to run out of a single byte to represent stuff
 #define PROT_1 254 // Protocol 1
 #define PROT_2 253 // Protocol 2
+#define PROT_3 252 // Protocol 3, which is protocol 2 with the packed list type values added
 
-#define PROT_D PROT_2 // The default protocol
+#define PROT_D PROT_2 // The default protocol, which is upgraded to protocol 3 when packed values are written
 
 // # 'Standard' values
 
@@ -271,6 +272,32 @@
 // Literal NULL
 #define NULL_S 103
 
+// # 'Packed list type' values
+
+/*
+  Lists and tuples of which all items are ints that fit in 8 bytes, or of
+  which all items are floats, are written packed. Instead of a datachar per
+  item, the items are written directly after each other as 8 byte values.
+  The ints are written little-endian, like the regular ints, and the floats
+  as C doubles, like the regular floats. The number of items is written
+  with the dynamic 1 method.
+
+    'DATACHAR + SIZE_BYTES_LENGTH + SIZE_BYTES + ITEMS'
+
+  These datachars use an 'I' tag for ints, and an 'F' tag for floats. They
+  were added in protocol 3, which is only written when the bytes hold them.
+  Older readers then reject those bytes instead of failing on an unknown
+  datachar, while they can still read all other bytes.
+*/
+
+// Packed list
+#define PLIST_I 104
+#define PLIST_F 105
+
+// Packed tuple
+#define PTUPLE_I 106
+#define PTUPLE_F 107
+
 // # The return status codes
 
 typedef enum {
@@ -286,6 +313,9 @@ typedef enum {
 
 #define ALLOC_SIZE 128 // The size to add when (re)allocating space for bytes
 #define MAX_NESTS  101 // The maximun amount of nests allowed, plus 1
+#define PACK_MIN     8 // The minimum number of items to write a list or tuple packed
+#define NT_CACHE   256 // The maximum amount of namedtuple types to cache
+#define SCRATCH_MAX (64 * 1024 * 1024) // The maximum size of the scratch buffer to keep between calls
 
 // Datetime module classes
 PyObject *datetime_dt; // datetime
@@ -300,14 +330,25 @@ PyObject *decimal_cl;
 
 // Collections module classes
 PyObject *namedtuple_cl;
-PyObject *deque_cl;
-PyObject *counter_cl;
-PyObject *ordereddict_cl;
-PyObject *chainmap_cl;
+static PyObject *deque_cl;
+static PyObject *counter_cl;
+static PyObject *ordereddict_cl;
+static PyObject *chainmap_cl;
 
 // Pathlib Path and PurePath classes
-PyObject *path_cl;
-PyObject *purepath_cl;
+static PyObject *path_cl;
+static PyObject *purepath_cl;
+
+// Namedtuple types that were created while decoding, keyed by their (name, fields) tuple
+static PyObject *namedtuple_types;
+
+// The scratch buffer that `from_value_into` converts into, which is kept and reused between calls
+static unsigned char *scratch_bytes;
+static Py_ssize_t scratch_size;
+static int scratch_in_use;
+
+// The singleton values, indexed by their datachar minus BOOL_T. The complex datachar in between is NULL
+static PyObject *singletons[ELLIPSIS_S - BOOL_T + 1];
 
 // # Initialization and cleanup functions
 
@@ -324,6 +365,12 @@ int sbs2_init(void)
     // Init the other protocols
     sbs1_init();
 
+    // Set the singleton values
+    singletons[BOOL_T - BOOL_T] = Py_True;
+    singletons[BOOL_F - BOOL_T] = Py_False;
+    singletons[NONE_S - BOOL_T] = Py_None;
+    singletons[ELLIPSIS_S - BOOL_T] = Py_Ellipsis;
+
     // Import the datetime module
     PyDateTime_IMPORT;
 
@@ -444,6 +491,10 @@ int sbs2_init(void)
         return -1;
     }
 
+    // Create the cache for the namedtuple types
+    namedtuple_types = PyDict_New();
+    if (namedtuple_types == NULL) return -1;
+
     // Get the pathlib module
     PyObject *pathlib_m = PyImport_ImportModule("pathlib");
     if (pathlib_m == NULL)
@@ -485,8 +536,13 @@ void sbs2_cleanup(void)
     Py_XDECREF(counter_cl);
     Py_XDECREF(ordereddict_cl);
     Py_XDECREF(chainmap_cl);
+    Py_XDECREF(namedtuple_types);
     Py_XDECREF(path_cl);
     Py_XDECREF(purepath_cl);
+
+    free(scratch_bytes);
+    scratch_bytes = NULL;
+    scratch_size = 0;
 }
 
 // # Helper functions for the from-conversion functions
@@ -497,6 +553,7 @@ typedef struct {
     Py_ssize_t max_size;
     int nests;
     unsigned char *bytes;
+    int packed; // Whether packed list type values were written, which need protocol 3
 } ValueData;
 
 // This function resizes the bytes of the ValueData when necessary
@@ -514,12 +571,14 @@ static inline StatusCode auto_resize_vd(ValueData *vd, Py_ssize_t jump)
     {
         // Update the max size
         vd->max_size += jump + ALLOC_SIZE;
+
         // Reallocate to the new max size
         unsigned char *temp = (unsigned char *)realloc((void *)(vd->bytes), vd->max_size * sizeof(unsigned char));
         if (temp == NULL)
         {
             // Free the already allocated bytes
             free(vd->bytes);
+            vd->bytes = NULL;
             return SC_NOMEMORY;
         }
 
@@ -569,7 +628,7 @@ static inline ValueData init_vd(PyObject *value, StatusCode *status)
     size_t max_size = (_PySys_GetSizeOf(value) * 2) + ALLOC_SIZE;
 
     // Create the struct itself
-    ValueData vd = {1, (Py_ssize_t)max_size, 0, (unsigned char *)malloc(max_size * sizeof(unsigned char))};
+    ValueData vd = {1, (Py_ssize_t)max_size, 0, (unsigned char *)malloc(max_size * sizeof(unsigned char)), 0};
     if (vd.bytes == NULL)
     {
         // Set the status
@@ -835,8 +894,12 @@ static inline StatusCode from_integer(ValueData *vd, PyObject *value)
     
     if (!PyLong_Check(value)) return SC_INCORRECT;
 
-    // Calculate number of bytes needed, including the sign bit
-    size_t num_bytes = Py_SIZE(value) > 0 ? (_PyLong_NumBits(value) + 8) / 8 : 1;
+    // Calculate number of bytes needed, including the sign bit. Negative ints are counted by their absolute value,
+    // which never takes fewer bits than their two's complement
+    size_t num_bits = _PyLong_NumBits(value);
+    if (num_bits == (size_t)-1) return SC_EXCEPTION;
+
+    size_t num_bytes = (num_bits + 8) / 8;
 
     // Determine datachar and dynamic length
     unsigned char datachar;
@@ -1194,9 +1257,79 @@ static inline StatusCode from_path(ValueData *vd, PyObject *value, const unsigne
 // Pre-definition for the items in the iterables
 static inline StatusCode from_any_value(ValueData *vd, PyObject *value);
 
+// Function for writing a list or tuple packed, returns SC_INCORRECT without writing anything if it can't be packed
+static inline StatusCode from_packed(ValueData *vd, PyObject *value, const unsigned char int_datachar) // Get the ints datachar, the floats one comes after it
+{
+    /*
+      A list or tuple can be written packed if all its items are either exact
+      ints or exact floats. Subclasses, like bools, have to keep their type,
+      so those still go through the regular item conversion.
+
+    */
+
+    Py_ssize_t num_items = PySequence_Fast_GET_SIZE(value);
+    if (num_items < PACK_MIN) return SC_INCORRECT;
+
+    // Check whether all items have the same type as the first item
+    PyObject **items = PySequence_Fast_ITEMS(value);
+    PyTypeObject *type = Py_TYPE(items[0]);
+    if (type != &PyLong_Type && type != &PyFloat_Type) return SC_INCORRECT;
+
+    for (Py_ssize_t i = 1; i < num_items; i++)
+    {
+        if (Py_TYPE(items[i]) != type) return SC_INCORRECT;
+    }
+
+    const int is_float = type == &PyFloat_Type;
+
+    // Save the offset to go back to if an int turns out to be too large
+    Py_ssize_t start_offset = vd->offset;
+
+    // Write the metadata, and resize for the items
+    if (write_dynamic1_metadata(vd, int_datachar + is_float, num_items, get_num_bytes(num_items)) == SC_NOMEMORY) return SC_NOMEMORY;
+    if (auto_resize_vd(vd, num_items * 8) == SC_NOMEMORY) return SC_NOMEMORY;
+
+    for (Py_ssize_t i = 0; i < num_items; i++)
+    {
+        if (is_float)
+        {
+            double num = PyFloat_AS_DOUBLE(items[i]);
+            memcpy(&(vd->bytes[vd->offset]), &num, 8);
+        }
+        else
+        {
+            int overflow;
+            int64_t num = (int64_t)PyLong_AsLongLongAndOverflow(items[i], &overflow);
+
+            // Go back to write the items regularly if the int doesn't fit in 8 bytes
+            if (overflow != 0)
+            {
+                vd->offset = start_offset;
+                return SC_INCORRECT;
+            }
+
+            // Write the int little-endian, regardless of the byte order of the system
+            uint64_t bits = (uint64_t)num;
+            for (int b = 0; b < 8; b++)
+            {
+                vd->bytes[vd->offset + b] = (unsigned char)(bits >> (b * 8));
+            }
+        }
+
+        vd->offset += 8;
+    }
+
+    vd->packed = 1;
+    return SC_SUCCESS;
+}
+
 static inline StatusCode from_list(ValueData *vd, PyObject *value)
 {
     if (!PyList_Check(value)) return SC_INCORRECT;
+
+    // Write the list packed if possible
+    StatusCode packed_status = from_packed(vd, value, PLIST_I);
+    if (packed_status != SC_INCORRECT) return packed_status;
     
     // Increment the nest depth and return if it's too deep
     if (increment_nests(vd) == SC_NESTDEPTH) return SC_NESTDEPTH;
@@ -1226,6 +1359,10 @@ static inline StatusCode from_list(ValueData *vd, PyObject *value)
 static inline StatusCode from_tuple(ValueData *vd, PyObject *value)
 {
     // Already checked if it's a tuple
+
+    // Write the tuple packed if possible
+    StatusCode packed_status = from_packed(vd, value, PTUPLE_I);
+    if (packed_status != SC_INCORRECT) return packed_status;
     
     // Increment the nest depth and return if it's too deep
     if (increment_nests(vd) == SC_NESTDEPTH) return SC_NESTDEPTH;
@@ -1468,6 +1605,19 @@ static inline StatusCode from_any_value(ValueData *vd, PyObject *value)
     {
         return from_static_value(vd, NULL_S);
     }
+    // Check for the singletons, which only take a pointer comparison
+    else if (value == Py_None)
+    {
+        return from_static_value(vd, NONE_S);
+    }
+    else if (value == Py_True || value == Py_False)
+    {
+        return from_static_value(vd, value == Py_True ? BOOL_T : BOOL_F);
+    }
+    else if (value == Py_Ellipsis)
+    {
+        return from_static_value(vd, ELLIPSIS_S);
+    }
     // Check for special types that stand under tuples and types
     else if (PyTuple_Check(value))
     {
@@ -1584,6 +1734,42 @@ static inline StatusCode from_any_value(ValueData *vd, PyObject *value)
     }
 }
 
+// Function to set the error that belongs to a status code
+static void set_status_error(StatusCode status)
+{
+    // Check what error we encountered
+    switch (status)
+    {
+    case SC_INCORRECT:
+    case SC_UNSUPPORTED:
+    {
+        // Incorrect datatype, likely an unsupported one
+        PyErr_SetString(PyExc_ValueError, "Received an unsupported datatype.");
+        break;
+    }
+    case SC_NESTDEPTH:
+    {
+        // Exceeded the maximum nest depth
+        PyErr_SetString(PyExc_ValueError, "Exceeded the maximum value nest depth.");
+        break;
+    }
+    case SC_NOMEMORY:
+    {
+        // Not enough memory, unless a more specific error was already set while resizing
+        if (!PyErr_Occurred())
+            PyErr_SetString(PyExc_MemoryError, "Not enough memory space available for use.");
+        break;
+    }
+    case SC_EXCEPTION: break; // Error message is set by the returner
+    default:
+    {
+        // Something unknown went wrong
+        PyErr_SetString(PyExc_RuntimeError, "Something unexpected went wrong, and we couldn't quite catch what it was.");
+        break;
+    }
+    }
+}
+
 PyObject *from_value(PyObject *value)
 {
     // Check if the value is NULL
@@ -1599,9 +1785,11 @@ PyObject *from_value(PyObject *value)
     ValueData vd = init_vd(value, &vd_status);
 
     // Return on status error
-    if (vd_status == SC_EXCEPTION)
-        // Exception already set
+    if (vd_status != SC_SUCCESS)
+    {
+        set_status_error(vd_status);
         return NULL;
+    }
 
     // Write the value and get the status
     StatusCode status = from_any_value(&vd, value);
@@ -1609,6 +1797,9 @@ PyObject *from_value(PyObject *value)
     // Check the status and throw an appropriate error if not success
     if (status == SC_SUCCESS)
     {
+        // Upgrade the protocol when packed values were written, which older readers don't know
+        if (vd.packed) vd.bytes[0] = PROT_3;
+
         // Convert it to a Python bytes object
         PyObject *py_bytes = PyBytes_FromStringAndSize((const char *)(vd.bytes), vd.offset);
         free(vd.bytes);
@@ -1617,39 +1808,155 @@ PyObject *from_value(PyObject *value)
     else
     {
         free(vd.bytes);
-        // Check what error we encountered
-        switch (status)
-        {
-        case SC_INCORRECT:
-        case SC_UNSUPPORTED:
-        {
-            // Incorrect datatype, likely an unsupported one
-            PyErr_SetString(PyExc_ValueError, "Received an unsupported datatype.");
-            break;
-        }
-        case SC_NESTDEPTH:
-        {
-            // Exceeded the maximum nest depth
-            PyErr_SetString(PyExc_ValueError, "Exceeded the maximum value nest depth.");
-            break;
-        }
-        case SC_NOMEMORY:
+        set_status_error(status);
+        return NULL;
+    }
+}
+
+Py_ssize_t from_value_into(PyObject *bytearray, PyObject *value)
+{
+    /*
+      This function writes the bytes into the given bytearray, which is
+      only resized when the value doesn't fit in it. This lets the caller
+      reuse the same bytearray for multiple values, without creating a
+      new bytes object for each of them.
+
+      The value is converted into a scratch buffer first and copied over
+      after, as the value might be or hold the bytearray itself (or a
+      memoryview of it), which would otherwise be overwritten or resized
+      while we're still reading from it. The scratch buffer is kept for
+      the next call, so that it doesn't have to be allocated each time.
+
+    */
+
+    // Use our own bytes when the scratch buffer is in use, like by Python code that a conversion called
+    const int use_scratch = !scratch_in_use;
+
+    StatusCode status = SC_SUCCESS;
+    ValueData vd;
+
+    if (use_scratch)
+    {
+        // Allocate the scratch buffer with the estimated size of the value the first time, like `init_vd` does
+        Py_ssize_t max_size = scratch_bytes == NULL ? (Py_ssize_t)(_PySys_GetSizeOf(value) * 2) + ALLOC_SIZE : 0;
+        if (max_size > scratch_size)
         {
-            // Not enough memory
-            PyErr_SetString(PyExc_MemoryError, "Not enough memory space available for use.");
-            break;
+            unsigned char *temp = (unsigned char *)realloc((void *)scratch_bytes, max_size * sizeof(unsigned char));
+            if (temp == NULL)
+            {
+                set_status_error(SC_NOMEMORY);
+                return -1;
+            }
+
+            scratch_bytes = temp;
+            scratch_size = max_size;
         }
-        case SC_EXCEPTION: break; // Error message is set by the returner
-        default:
+
+        // Write the protocol byte
+        vd = (ValueData){1, scratch_size, 0, scratch_bytes, 0};
+        vd.bytes[0] = PROT_D;
+
+        scratch_in_use = 1;
+    }
+    else
+    {
+        vd = init_vd(value, &status);
+    }
+
+    // Write the value and get the status
+    if (status == SC_SUCCESS)
+    {
+        status = from_any_value(&vd, value);
+    }
+
+    if (use_scratch)
+    {
+        // Keep the bytes, which might be reallocated, or freed when reallocating failed
+        scratch_bytes = vd.bytes;
+        scratch_size = vd.bytes == NULL ? 0 : vd.max_size;
+        scratch_in_use = 0;
+    }
+
+    if (status != SC_SUCCESS)
+    {
+        if (!use_scratch) free(vd.bytes);
+        set_status_error(status);
+        return -1;
+    }
+
+    // Upgrade the protocol when packed values were written, which older readers don't know
+    if (vd.packed) vd.bytes[0] = PROT_3;
+
+    // Grow the bytearray when the bytes don't fit in it, the error is already set on failure
+    Py_ssize_t size = vd.offset;
+    if (size > PyByteArray_GET_SIZE(bytearray) && PyByteArray_Resize(bytearray, size) == -1)
+    {
+        if (!use_scratch) free(vd.bytes);
+        return -1;
+    }
+
+    // Copy the bytes over
+    memcpy(PyByteArray_AS_STRING(bytearray), vd.bytes, size);
+
+    // Free our own bytes, and don't keep a very large scratch buffer around
+    if (!use_scratch || scratch_size > SCRATCH_MAX)
+    {
+        free(vd.bytes);
+        if (use_scratch)
         {
-            // Something unknown went wrong
-            PyErr_SetString(PyExc_RuntimeError, "Something unexpected went wrong, and we couldn't quite catch what it was.");
-            break;
-        }
+            scratch_bytes = NULL;
+            scratch_size = 0;
         }
+    }
+
+    // Return the number of bytes written
+    return size;
+}
+
+PyObject *from_values(PyObject *iterable)
+{
+    /*
+      This function writes the items of the iterable directly after each other,
+      without the metadata of a list around them. Multiple of these bytes objects
+      can thus be concatenated, and converted back using `to_values_buffer` to
+      get all items of them in a single list.
+
+    */
+
+    PyObject *iter = PyObject_GetIter(iterable);
+    if (iter == NULL) return NULL; // Error already set
 
+    // Initiate the ValueData
+    StatusCode status;
+    ValueData vd = init_vd(iterable, &status);
+
+    // Go over the items and write them until we run out of items or encounter an error
+    PyObject *item;
+    while (status == SC_SUCCESS && (item = PyIter_Next(iter)) != NULL)
+    {
+        status = from_any_value(&vd, item);
+        Py_DECREF(item);
+    }
+
+    Py_DECREF(iter);
+
+    // Check whether the iterator itself raised an error
+    if (status == SC_SUCCESS && PyErr_Occurred()) status = SC_EXCEPTION;
+
+    if (status != SC_SUCCESS)
+    {
+        free(vd.bytes);
+        set_status_error(status);
         return NULL;
     }
+
+    // Upgrade the protocol when packed values were written, which older readers don't know
+    if (vd.packed) vd.bytes[0] = PROT_3;
+
+    // Convert it to a Python bytes object
+    PyObject *py_bytes = PyBytes_FromStringAndSize((const char *)(vd.bytes), vd.offset);
+    free(vd.bytes);
+    return py_bytes;
 }
 
 // # Helper functions for the to-conversion functions
@@ -1689,39 +1996,131 @@ static inline int ensure_offset(ByteData *bd, size_t jump)
 }
 
 // Function for getting the size byte length of the dynamic 1 method
+// Function to check whether the bytes that are left can hold the given number of items
+static inline int ensure_items(ByteData *bd, size_t num_items)
+{
+    // Each item takes at least one byte, which also keeps an invalid number of items from being allocated
+    if (num_items > bd->max_offset - bd->offset)
+    {
+        PyErr_SetString(PyExc_ValueError, "Likely received an invalid bytes object: offset exceeded max limit.");
+        return -1;
+    }
+
+    return 1;
+}
+
 static inline size_t D1_length(ByteData *bd)
 {
-    // Ensure offset for the first size byte
-    if (ensure_offset(bd, 1) == -1) return 0;
+    // Ensure offset for the datachar and the first size byte
+    if (ensure_offset(bd, 2) == -1) return 0;
 
     // Get the length of the length bytes from the 1st character away from the offset
     size_t size_bytes_length = bytes_to_size_t(&(bd->bytes[++bd->offset]), 1);
+
+    // A length of zero is never written, and is returned to indicate failure
+    if (size_bytes_length == 0)
+        PyErr_SetString(PyExc_ValueError, "Likely received an invalid bytes object: invalid size bytes length.");
+
     return size_bytes_length;
 }
 
 // Function for getting the size byte length of the dynamic 2 method
 static inline size_t D2_length(ByteData *bd)
 {
-    // Ensure offset for the first size byte
-    if (ensure_offset(bd, 1) == -1) return 0;
+    // Ensure offset for the datachar and the first size byte
+    if (ensure_offset(bd, 2) == -1) return 0;
 
     // Get the length of the length of the length bytes (sounds complicated, but explained in 'write_E12D' function)
     size_t length = bytes_to_size_t(&(bd->bytes[++bd->offset]), 1);
 
-    // Ensure the offset for the 2nd size bytes
-    if (ensure_offset(bd, length) == -1) return 0;
+    // Ensure the offset for the 2nd size bytes, which come after the first size byte
+    if (ensure_offset(bd, length + 1) == -1) return 0;
 
     // Get the length of the length bytes
     size_t size_bytes_length = bytes_to_size_t(&(bd->bytes[++bd->offset]), length);
 
+    // A length of zero is never written, and is returned to indicate failure
+    if (size_bytes_length == 0)
+        PyErr_SetString(PyExc_ValueError, "Likely received an invalid bytes object: invalid size bytes length.");
+
     // Update the offset to start at the value bytes
     bd->offset += length - 1;
 
     return size_bytes_length;
 }
 
+// Function to call one of the cached classes with a single argument, or with none if `arg` is NULL
+static inline PyObject *call_class(PyObject *cl, PyObject *arg)
+{
+#if PY_VERSION_HEX >= 0x03090000
+    // Vectorcall passes the argument without packing it into a tuple first
+    PyObject *args[1] = {arg};
+    return PyObject_Vectorcall(cl, args, arg == NULL ? 0 : 1, NULL);
+#else
+    return PyObject_CallFunctionObjArgs(cl, arg, NULL);
+#endif
+}
+
+// Function to get the namedtuple type with the given name and fields. Returns a new reference
+static inline PyObject *get_namedtuple_type(PyObject *name, PyObject *fields)
+{
+    /*
+      Creating a namedtuple type is slow, as `namedtuple` builds and evaluates
+      its class on each call. The types are cached by their name and fields,
+      so decoding the same namedtuple again reuses the type created before.
+      The names and fields come from the bytes we decode, so the cache is
+      capped to not let untrusted bytes grow it without bounds.
+    */
+
+    PyObject *key = PyTuple_Pack(2, name, fields);
+    if (key == NULL) return NULL;
+
+    // Check whether the type was created before (borrowed reference)
+    PyObject *nt_type = PyDict_GetItemWithError(namedtuple_types, key);
+    if (nt_type != NULL)
+    {
+        Py_DECREF(key);
+        Py_INCREF(nt_type);
+        return nt_type;
+    }
+    else if (PyErr_Occurred())
+    {
+        Py_DECREF(key);
+        return NULL;
+    }
+
+    // Create the namedtuple type and cache it, if the cache isn't full yet
+    nt_type = PyObject_CallFunctionObjArgs(namedtuple_cl, name, fields, NULL);
+    if (nt_type != NULL && PyDict_GET_SIZE(namedtuple_types) < NT_CACHE && PyDict_SetItem(namedtuple_types, key, nt_type) == -1)
+    {
+        Py_CLEAR(nt_type);
+    }
+
+    Py_DECREF(key);
+    return nt_type;
+}
+
 // # The to-conversion functions
 
+/*
+  The datachars are dispatched with a table of label addresses (computed
+  goto) where supported, as it takes a single indirect jump without the
+  bounds check of a switch. Other compilers use a regular switch.
+
+*/
+
+#if defined(__GNUC__) || defined(__clang__)
+#define USE_COMPUTED_GOTO
+#endif
+
+#ifdef USE_COMPUTED_GOTO
+#define TARGET(datachar) target_##datachar
+#define TARGET_DEFAULT target_default
+#else
+#define TARGET(datachar) case datachar
+#define TARGET_DEFAULT default
+#endif
+
 // Pre-definition of the global conversion function to use it in to-conversion functions
 static inline PyObject *to_any_value(ByteData *bd);
 
@@ -1747,17 +2146,18 @@ static inline PyObject *to_str_gen(ByteData *bd, size_t size_bytes_length)
 
     if (ensure_offset(bd, length) == -1) return NULL;
 
-    // Copy the value bytes into a PyBytes object
-    PyObject *item_bytes = PyBytes_FromStringAndSize((const char *)(&(bd->bytes[bd->offset])), length);
+    /*
+    
+    Decode the bytes directly from the input buffer. This avoids copying the bytes into a
+    PyBytes object first, and the UTF-8 decoder scans ASCII data a machine word at a time.
+    
+    */
+
+    PyObject *value = PyUnicode_DecodeUTF8((const char *)(&(bd->bytes[bd->offset])), length, "strict");
 
     // Update the offset to start at the next item
     bd->offset += length;
 
-    // Get the value of the bytes
-    PyObject *value = PyUnicode_FromEncodedObject(item_bytes, "utf-8", "strict");
-
-    Py_DECREF(item_bytes);
-
     return value;
 }
 
@@ -1790,14 +2190,42 @@ static inline PyObject *to_float_s(ByteData *bd)
     return float_obj;
 }
 
-// Generic method to convert bool values
-static inline PyObject *to_bool_gen(ByteData *bd, PyObject *bool_value)
+// Generic method to convert the singleton values (True, False, None, and Ellipsis)
+static inline PyObject *to_singleton(ByteData *bd, const unsigned char datachar)
 {
     if (ensure_offset(bd, 1) == -1) return NULL;
 
     // Increment once to skip over the datachar
     bd->offset++;
-    return bool_value;
+
+    // Get the singleton from the lookup table
+    PyObject *value = singletons[datachar - BOOL_T];
+    Py_INCREF(value);
+    return value;
+}
+
+// Function to get the item at the offset if it's a singleton, or NULL without an error set if it isn't
+static inline PyObject *to_singleton_item(ByteData *bd)
+{
+    /*
+      Containers often hold many singleton items, like a list of Nones. Their
+      items are checked with this function first, so that those items don't
+      have to go through the datachar dispatch of the to-any-value function.
+
+    */
+
+    if (bd->offset >= bd->max_offset) return NULL;
+
+    const unsigned char datachar = bd->bytes[bd->offset];
+
+    // Check whether the datachar is within the singleton range, which has the complex datachar in between
+    if (datachar < BOOL_T || datachar > ELLIPSIS_S || datachar == COMPLEX_S) return NULL;
+
+    bd->offset++;
+
+    PyObject *value = singletons[datachar - BOOL_T];
+    Py_INCREF(value);
+    return value;
 }
 
 static inline PyObject *to_complex_s(ByteData *bd)
@@ -1820,22 +2248,6 @@ static inline PyObject *to_complex_s(ByteData *bd)
     return PyComplex_FromCComplex(c);
 }
 
-static inline PyObject *to_none_s(ByteData *bd)
-{
-    if (ensure_offset(bd, 1) == -1) return NULL;
-
-    bd->offset++;
-    return Py_None;
-}
-
-static inline PyObject *to_ellipsis_s(ByteData *bd)
-{
-    if (ensure_offset(bd, 1) == -1) return NULL;
-
-    bd->offset++;
-    return Py_Ellipsis;
-}
-
 // This function works for both regular bytes and a bytearray
 static inline PyObject *to_bytes_e(ByteData *bd, int is_bytearray)
 {
@@ -1843,7 +2255,7 @@ static inline PyObject *to_bytes_e(ByteData *bd, int is_bytearray)
 
     bd->offset++;
     // Create and return an empty bytes object
-    return is_bytearray ? PyBytes_FromStringAndSize(NULL, 0) : PyByteArray_FromStringAndSize(NULL, 0);
+    return is_bytearray == 0 ? PyBytes_FromStringAndSize(NULL, 0) : PyByteArray_FromStringAndSize(NULL, 0);
 }
 
 // Generic method for bytes/bytearray conversion
@@ -1868,24 +2280,22 @@ static inline PyObject *to_bytes_gen(ByteData *bd, size_t size_bytes_length, int
 // Generic method for datetime object conversion
 static inline PyObject *to_datetime_gen(ByteData *bd, PyObject *method)
 {
-    if (ensure_offset(bd, 1) == -1) return NULL;
+    if (ensure_offset(bd, 2) == -1) return NULL;
 
     // Get the length of the datetime bytes
     size_t length = bytes_to_size_t(&(bd->bytes[++bd->offset]), 1);
 
     if (ensure_offset(bd, length + 1) == -1) return NULL;
     
-    // Grab the iso string from the C bytes
-    PyObject *iso_bytes =  PyBytes_FromStringAndSize((const char *)(&(bd->bytes[++bd->offset])), length);
+    // Get the iso string back from the C bytes
+    PyObject *iso = PyUnicode_DecodeUTF8((const char *)(&(bd->bytes[++bd->offset])), length, "strict");
     bd->offset += length;
 
-    // Get the iso string back
-    PyObject *iso = PyUnicode_FromEncodedObject(iso_bytes, "utf-8", "strict");
+    if (iso == NULL) return NULL;
 
     // Convert the iso string back to a datetime object
     PyObject *datetime_obj = PyObject_CallMethod(method, "fromisoformat", "O", iso); // The parsed method is the class to call
 
-    Py_DECREF(iso_bytes);
     Py_DECREF(iso);
 
     return datetime_obj;
@@ -1893,6 +2303,8 @@ static inline PyObject *to_datetime_gen(ByteData *bd, PyObject *method)
 
 static inline PyObject *to_timedelta_s(ByteData *bd)
 {
+    if (ensure_offset(bd, (size_t)sizeof(int) * 3 + 1) == -1) return NULL;
+
     // These will hold the days, seconds, and microseconds from the timedelta object
     int days, seconds, microseconds;
 
@@ -1913,11 +2325,15 @@ static inline PyObject *to_uuid_s(ByteData *bd)
 {
     if (ensure_offset(bd, 33) == -1) return NULL;
 
-    // Convert the bytes back to a uuid object
-    PyObject* uuid = PyObject_CallFunction(uuid_cl, "O", PyUnicode_FromStringAndSize((const char *)(&(bd->bytes[++bd->offset])), 32)); // 32 because UUIDs are always of that length
+    // Get the hex string of the uuid, which is 32 characters long
+    PyObject *hex_str = PyUnicode_FromStringAndSize((const char *)(&(bd->bytes[++bd->offset])), 32);
+    if (hex_str == NULL) return NULL;
+
+    // Convert the hex string back to a uuid object
+    PyObject *uuid = call_class(uuid_cl, hex_str);
+    Py_DECREF(hex_str);
     if (uuid == NULL)
     {
-        Py_XDECREF(uuid);
         PyErr_SetString(PyExc_RuntimeError, "Failed to create UUID object.");
         return NULL;
     }
@@ -1931,6 +2347,7 @@ static inline PyObject *to_uuid_s(ByteData *bd)
 static inline PyObject *to_memoryview_e(ByteData *bd)
 {
     if (ensure_offset(bd, 1) == -1) return NULL;
+    bd->offset++;
 
     // Create and return an empty memoryview object using an empty bytes object
     PyObject *empty_obj = PyBytes_FromStringAndSize(NULL, 0);
@@ -1980,11 +2397,11 @@ static inline PyObject *to_decimal_gen(ByteData *bd, size_t size_bytes_length)
 
     // Get the bytes of the decimal
     PyObject *decimal_str = PyUnicode_FromStringAndSize((const char *)(&(bd->bytes[bd->offset])), length);
+    if (decimal_str == NULL) return NULL;
 
     // Convert it to a decimal
-    PyObject *args = PyTuple_Pack(1, decimal_str);
-    PyObject *decimal = PyObject_CallFunction(decimal_cl, "O", decimal_str);
-    Py_DECREF(args);
+    PyObject *decimal = call_class(decimal_cl, decimal_str);
+    Py_DECREF(decimal_str);
     if (decimal == NULL) {
         PyErr_SetString(PyExc_RuntimeError, "Failed to convert string to Decimal.");
         return NULL;
@@ -2002,8 +2419,15 @@ static inline PyObject *to_range_s(ByteData *bd)
 
     // Get the Python integers that represent the start, stop, and step
     PyObject *start = to_any_value(bd);
-    PyObject *stop  = to_any_value(bd);
-    PyObject *step  = to_any_value(bd);
+    PyObject *stop  = start == NULL ? NULL : to_any_value(bd);
+    PyObject *step  = stop == NULL ? NULL : to_any_value(bd);
+
+    if (step == NULL)
+    {
+        Py_XDECREF(start);
+        Py_XDECREF(stop);
+        return NULL; // Error already set
+    }
 
     // Create a range object with the attributes by calling the range class
     PyObject *range = PyObject_CallFunction((PyObject *)&PyRange_Type, "OOO", start, stop, step);
@@ -2041,19 +2465,14 @@ static inline PyObject *to_path_gen(ByteData *bd, size_t size_bytes_length, PyOb
 
     if (ensure_offset(bd, length) == -1) return NULL;
 
-    // This will hold the path string
-    char path_str[length + 1]; // Plus 1 for null-terminator
-
-    // Copy the bytes into the path string
-    memcpy(path_str, &(bd->bytes[bd->offset]), length);
-    // Null-terminate the path string
-    path_str[length] = '\0';
+    // Get the pointer to the path string, which isn't null-terminated
+    const char *path_str = (const char *)&(bd->bytes[bd->offset]);
 
     // Update the offset
     bd->offset += length;
 
     // Create and return the Path/PurePath object
-    return PyObject_CallFunction(type_cl, "s", path_str);;
+    return PyObject_CallFunction(type_cl, "s#", path_str, (Py_ssize_t)length);
 }
 
 static inline PyObject *to_null(ByteData *bd)
@@ -2084,13 +2503,18 @@ static inline PyObject *to_list_gen(ByteData *bd, size_t size_bytes_length)
     size_t num_items = bytes_to_size_t(&(bd->bytes[++bd->offset]), size_bytes_length);
     bd->offset += size_bytes_length;
 
+    if (ensure_items(bd, num_items) == -1) return NULL;
+
     // Create a list with the amount of items we expect
     PyObject *list = PyList_New(num_items);
+    if (list == NULL) return NULL;
 
     // Go over each item and add them to the list
     for (size_t i = 0; i < num_items; i++)
     {
-        PyObject *item = to_any_value(bd);
+        // Get singletons directly, and dispatch on the datachar for other items
+        PyObject *item = to_singleton_item(bd);
+        if (item == NULL) item = to_any_value(bd);
 
         // Check if the item actually exists
         if (item == NULL)
@@ -2124,13 +2548,18 @@ static inline PyObject *to_tuple_gen(ByteData *bd, size_t size_bytes_length)
     size_t num_items = bytes_to_size_t(&(bd->bytes[++bd->offset]), size_bytes_length);
     bd->offset += size_bytes_length;
 
+    if (ensure_items(bd, num_items) == -1) return NULL;
+
     // Create a tuple with the amount of items we expect
     PyObject *tuple = PyTuple_New(num_items);
+    if (tuple == NULL) return NULL;
 
     // Go over each item and add them to the tuple
     for (Py_ssize_t i = 0; i < (Py_ssize_t)num_items; i++)
     {
-        PyObject *item = to_any_value(bd);
+        // Get singletons directly, and dispatch on the datachar for other items
+        PyObject *item = to_singleton_item(bd);
+        if (item == NULL) item = to_any_value(bd);
 
         // Check if the item actually exists
         if (item == NULL)
@@ -2147,6 +2576,66 @@ static inline PyObject *to_tuple_gen(ByteData *bd, size_t size_bytes_length)
     return tuple;
 }
 
+// Generic method for packed lists and tuples
+static inline PyObject *to_packed_gen(ByteData *bd, size_t size_bytes_length, int is_float, int is_tuple)
+{
+    if (ensure_offset(bd, size_bytes_length + 1) == -1) return NULL;
+
+    // Get the number of items
+    size_t num_items = bytes_to_size_t(&(bd->bytes[++bd->offset]), size_bytes_length);
+    bd->offset += size_bytes_length;
+
+    // Check whether all items are there, without overflowing on an invalid number of items
+    if (num_items > (bd->max_offset - bd->offset) / 8)
+    {
+        PyErr_SetString(PyExc_ValueError, "Likely received an invalid bytes object: offset exceeded max limit.");
+        return NULL;
+    }
+
+    // Create the list or tuple with the amount of items we expect
+    PyObject *seq = is_tuple ? PyTuple_New(num_items) : PyList_New(num_items);
+    if (seq == NULL) return NULL;
+
+    // Go over each item and add them to the list or tuple, without dispatching on a datachar
+    const unsigned char *bytes = &(bd->bytes[bd->offset]);
+    for (size_t i = 0; i < num_items; i++)
+    {
+        PyObject *item;
+        if (is_float)
+        {
+            double num;
+            memcpy(&num, &(bytes[i * 8]), 8);
+            item = PyFloat_FromDouble(num);
+        }
+        else
+        {
+            // Read the int little-endian, regardless of the byte order of the system
+            uint64_t bits = 0;
+            for (int b = 0; b < 8; b++)
+            {
+                bits |= (uint64_t)bytes[i * 8 + b] << (b * 8);
+            }
+            item = PyLong_FromLongLong((long long)(int64_t)bits);
+        }
+
+        if (item == NULL)
+        {
+            Py_DECREF(seq);
+            return NULL;
+        }
+
+        if (is_tuple)
+            PyTuple_SET_ITEM(seq, i, item);
+        else
+            PyList_SET_ITEM(seq, i, item);
+    }
+
+    // Update the offset to start at the next item
+    bd->offset += num_items * 8;
+
+    return seq;
+}
+
 // This function is used for the values also converted with the 'from_iterable' function
 static inline PyObject *to_iterable_e(ByteData *bd, const unsigned char empty) // Use the empty datachar to get the datatype
 {
@@ -2175,7 +2664,7 @@ static inline PyObject *to_iterable_e(ByteData *bd, const unsigned char empty) /
     }
     case DEQUE_E:
     {
-        iter = PyObject_CallFunction(deque_cl, "O", empty_list);
+        iter = call_class(deque_cl, empty_list);
         break;
     }
     default: // Shouldn't be reached, but just to be sure
@@ -2216,7 +2705,7 @@ static inline PyObject *to_iterable_gen(ByteData *bd, size_t size_bytes_length,
     }
     case DEQUE_E:
     {
-        iter = PyObject_CallFunction(deque_cl, "O", list);
+        iter = call_class(deque_cl, list);
         break;
     }
     default: // Shouldn't be reached, but just to be sure
@@ -2249,13 +2738,14 @@ static inline PyObject *to_dict_gen(ByteData *bd, size_t size_bytes_length)
 
     // Create an empty dict object
     PyObject *dict = PyDict_New();
+    if (dict == NULL) return NULL;
 
     // Go over each pair and add them to the dict
     for (size_t i = 0; i < num_items; i++)
     {
         // Create the key and the value, placed directly after each other
         PyObject *key = to_any_value(bd);
-        PyObject *value = to_any_value(bd);
+        PyObject *value = key == NULL ? NULL : to_any_value(bd);
 
         // Check if both items actually exist
         if (key == NULL || value == NULL)
@@ -2267,11 +2757,17 @@ static inline PyObject *to_dict_gen(ByteData *bd, size_t size_bytes_length)
             return NULL;
         }
 
-        // Place the key-value pair in the dict
-        PyDict_SetItem(dict, key, value);
+        // Place the key-value pair in the dict, which fails for unhashable keys
+        int set_result = PyDict_SetItem(dict, key, value);
 
         Py_DECREF(key);
         Py_DECREF(value);
+
+        if (set_result == -1)
+        {
+            Py_DECREF(dict);
+            return NULL;
+        }
     }
 
     return dict;
@@ -2283,7 +2779,7 @@ static inline PyObject *to_counter_e(ByteData *bd)
     bd->offset++;
 
     // Create and return a new counter
-    return PyObject_CallObject(counter_cl, NULL);
+    return call_class(counter_cl, NULL);
 }
 
 static inline PyObject *to_counter_gen(ByteData *bd, size_t size_bytes_length)
@@ -2296,13 +2792,14 @@ static inline PyObject *to_counter_gen(ByteData *bd, size_t size_bytes_length)
 
     // Create an empty dict
     PyObject *dict = PyDict_New();
+    if (dict == NULL) return NULL;
 
     // Go over each pair and add them to the dict
     for (size_t i = 0; i < num_items; i++)
     {
         // Create the key and the value, placed directly after each other
         PyObject *key = to_any_value(bd);
-        PyObject *value = to_any_value(bd);
+        PyObject *value = key == NULL ? NULL : to_any_value(bd);
 
         // Check if both items actually exist
         if (key == NULL || value == NULL)
@@ -2314,15 +2811,21 @@ static inline PyObject *to_counter_gen(ByteData *bd, size_t size_bytes_length)
             return NULL;
         }
 
-        // Place the key-value pair in the dict
-        PyDict_SetItem(dict, key, value);
+        // Place the key-value pair in the dict, which fails for unhashable keys
+        int set_result = PyDict_SetItem(dict, key, value);
 
         Py_DECREF(key);
         Py_DECREF(value);
+
+        if (set_result == -1)
+        {
+            Py_DECREF(dict);
+            return NULL;
+        }
     }
 
     // Create the Counter out of the dict
-    PyObject *counter = PyObject_CallFunctionObjArgs(counter_cl, dict, NULL);
+    PyObject *counter = call_class(counter_cl, dict);
     Py_DECREF(dict);
 
     return counter;
@@ -2334,7 +2837,7 @@ static inline PyObject *to_ordereddict_e(ByteData *bd)
     bd->offset++;
 
     // Create and return an empty OrderedDict object
-    return PyObject_CallObject(ordereddict_cl, NULL);
+    return call_class(ordereddict_cl, NULL);
 }
 
 static inline PyObject *to_ordereddict_gen(ByteData *bd, size_t size_bytes_length)
@@ -2347,13 +2850,14 @@ static inline PyObject *to_ordereddict_gen(ByteData *bd, size_t size_bytes_lengt
 
     // Create an empty dict
     PyObject *dict = PyDict_New();
+    if (dict == NULL) return NULL;
 
     // Go over each pair and add them to the dict
     for (size_t i = 0; i < num_items; i++)
     {
         // Create the key and the value, placed directly after each other
         PyObject *key = to_any_value(bd);
-        PyObject *value = to_any_value(bd);
+        PyObject *value = key == NULL ? NULL : to_any_value(bd);
 
         // Check if both items actually exist
         if (key == NULL || value == NULL)
@@ -2365,15 +2869,21 @@ static inline PyObject *to_ordereddict_gen(ByteData *bd, size_t size_bytes_lengt
             return NULL;
         }
 
-        // Place the key-value pair in the dict
-        PyDict_SetItem(dict, key, value);
+        // Place the key-value pair in the dict, which fails for unhashable keys
+        int set_result = PyDict_SetItem(dict, key, value);
 
         Py_DECREF(key);
         Py_DECREF(value);
+
+        if (set_result == -1)
+        {
+            Py_DECREF(dict);
+            return NULL;
+        }
     }
 
     // Create the OrderedDict out of the dict
-    PyObject *counter = PyObject_CallFunctionObjArgs(ordereddict_cl, dict, NULL);
+    PyObject *counter = call_class(ordereddict_cl, dict);
     Py_DECREF(dict);
 
     return counter;
@@ -2385,7 +2895,7 @@ static inline PyObject *to_chainmap_e(ByteData *bd)
     bd->offset++;
 
     // Create and return an empty ChainMap object
-    return PyObject_CallObject(chainmap_cl, NULL);
+    return call_class(chainmap_cl, NULL);
 }
 
 static inline PyObject *to_chainmap_gen(ByteData *bd, size_t size_bytes_length)
@@ -2396,14 +2906,21 @@ static inline PyObject *to_chainmap_gen(ByteData *bd, size_t size_bytes_length)
     size_t num_items = bytes_to_size_t(&(bd->bytes[++bd->offset]), size_bytes_length);
     bd->offset += size_bytes_length;
 
+    if (ensure_items(bd, num_items) == -1) return NULL;
+
     // This will hold the maps
     PyObject *maps = PyTuple_New(num_items);
+    if (maps == NULL) return NULL;
 
     for (size_t i = 0; i < num_items; i++)
     {
         // Get the item of the current map
         PyObject *item = to_any_value(bd);
-        if (item == NULL) return NULL;
+        if (item == NULL)
+        {
+            Py_DECREF(maps);
+            return NULL;
+        }
 
         // Place the dict into the maps tuple
         PyTuple_SET_ITEM(maps, i, item);
@@ -2430,13 +2947,14 @@ static inline PyObject *to_namedtuple_e(ByteData *bd)
     // Create an empty tuple to initialize the empty namedtuple with
     PyObject *empty_tuple = PyTuple_New(0);
 
-    // Create the namedtuple type
-    PyObject *nt_type = PyObject_CallFunction(namedtuple_cl, "OO", name, empty_tuple);
-    // Create the namedtuple using that type
-    PyObject *namedtuple = PyObject_CallObject(nt_type, empty_tuple);
-
+    // Get the namedtuple type
+    PyObject *nt_type = get_namedtuple_type(name, empty_tuple);
     Py_DECREF(name);
     Py_DECREF(empty_tuple);
+    if (nt_type == NULL) return NULL;
+
+    // Create the namedtuple using that type
+    PyObject *namedtuple = call_class(nt_type, NULL);
     Py_DECREF(nt_type);
 
     return namedtuple;
@@ -2450,6 +2968,8 @@ static inline PyObject *to_namedtuple_gen(ByteData *bd, size_t size_bytes_length
     size_t num_items = bytes_to_size_t(&(bd->bytes[++bd->offset]), size_bytes_length);
     bd->offset += size_bytes_length;
 
+    if (ensure_items(bd, num_items) == -1) return NULL;
+
     // Get the name of the namedtuple
     PyObject *name = to_any_value(bd);
     if (name == NULL) return NULL; // Error already set
@@ -2460,13 +2980,15 @@ static inline PyObject *to_namedtuple_gen(ByteData *bd, size_t size_bytes_length
     for (Py_ssize_t i = 0; i < (Py_ssize_t)num_items; i++)
     {
         // Get the field and item
-        PyObject *field = to_any_value(bd);
-        PyObject *item = to_any_value(bd);
+        PyObject *field = fields == NULL || items == NULL ? NULL : to_any_value(bd);
+        PyObject *item = field == NULL ? NULL : to_any_value(bd);
 
-        if (field == NULL || item == NULL)
+        if (item == NULL)
         {
             Py_XDECREF(field);
-            Py_XDECREF(item);
+            Py_DECREF(name);
+            Py_XDECREF(fields);
+            Py_XDECREF(items);
             // Error already set
             return NULL;
         }
@@ -2476,13 +2998,18 @@ static inline PyObject *to_namedtuple_gen(ByteData *bd, size_t size_bytes_length
         PyTuple_SetItem(items, i, item);
     }
 
-    // Create the namedtuple type
-    PyObject *nt_type = PyObject_CallFunctionObjArgs(namedtuple_cl, name, fields, NULL);
-    // Create the namedtuple using that type
-    PyObject *namedtuple = PyObject_CallObject(nt_type, items);
-
+    // Get the namedtuple type
+    PyObject *nt_type = get_namedtuple_type(name, fields);
     Py_DECREF(name);
     Py_DECREF(fields);
+    if (nt_type == NULL)
+    {
+        Py_DECREF(items);
+        return NULL;
+    }
+
+    // Create the namedtuple using that type
+    PyObject *namedtuple = PyObject_CallObject(nt_type, items);
     Py_DECREF(items);
     Py_DECREF(nt_type);
 
@@ -2491,15 +3018,138 @@ static inline PyObject *to_namedtuple_gen(ByteData *bd, size_t size_bytes_length
 
 static inline PyObject *to_any_value(ByteData *bd)
 {
-    // Get the datachar of the current value and switch over it
+    // Ensure there's a datachar left to read
+    if (ensure_offset(bd, 1) == -1) return NULL;
+
+    // Get the datachar of the current value and dispatch on it
     const unsigned char datachar = bd->bytes[bd->offset];
 
+#ifdef USE_COMPUTED_GOTO
+    // The label of each datachar, where all invalid datachars go to the default label
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Woverride-init"
+    static const void *const dispatch_table[256] = {
+        [0 ... 255] = &&TARGET_DEFAULT,
+        [STR_E] = &&TARGET(STR_E),
+        [STR_1] = &&TARGET(STR_1),
+        [STR_2] = &&TARGET(STR_2),
+        [STR_D1] = &&TARGET(STR_D1),
+        [STR_D2] = &&TARGET(STR_D2),
+        [INT_1] = &&TARGET(INT_1),
+        [INT_2] = &&TARGET(INT_2),
+        [INT_3] = &&TARGET(INT_3),
+        [INT_4] = &&TARGET(INT_4),
+        [INT_5] = &&TARGET(INT_5),
+        [INT_D1] = &&TARGET(INT_D1),
+        [INT_D2] = &&TARGET(INT_D2),
+        [BOOL_T] = &&TARGET(BOOL_T),
+        [BOOL_F] = &&TARGET(BOOL_F),
+        [NONE_S] = &&TARGET(NONE_S),
+        [ELLIPSIS_S] = &&TARGET(ELLIPSIS_S),
+        [FLOAT_S] = &&TARGET(FLOAT_S),
+        [COMPLEX_S] = &&TARGET(COMPLEX_S),
+        [BYTES_E] = &&TARGET(BYTES_E),
+        [BYTES_1] = &&TARGET(BYTES_1),
+        [BYTES_2] = &&TARGET(BYTES_2),
+        [BYTES_D1] = &&TARGET(BYTES_D1),
+        [BYTES_D2] = &&TARGET(BYTES_D2),
+        [BYTEARR_E] = &&TARGET(BYTEARR_E),
+        [BYTEARR_1] = &&TARGET(BYTEARR_1),
+        [BYTEARR_2] = &&TARGET(BYTEARR_2),
+        [BYTEARR_D1] = &&TARGET(BYTEARR_D1),
+        [BYTEARR_D2] = &&TARGET(BYTEARR_D2),
+        [DATETIME_DT] = &&TARGET(DATETIME_DT),
+        [DATETIME_TD] = &&TARGET(DATETIME_TD),
+        [DATETIME_D] = &&TARGET(DATETIME_D),
+        [DATETIME_T] = &&TARGET(DATETIME_T),
+        [UUID_S] = &&TARGET(UUID_S),
+        [MEMVIEW_E] = &&TARGET(MEMVIEW_E),
+        [MEMVIEW_1] = &&TARGET(MEMVIEW_1),
+        [MEMVIEW_2] = &&TARGET(MEMVIEW_2),
+        [MEMVIEW_D1] = &&TARGET(MEMVIEW_D1),
+        [MEMVIEW_D2] = &&TARGET(MEMVIEW_D2),
+        [DECIMAL_1] = &&TARGET(DECIMAL_1),
+        [DECIMAL_2] = &&TARGET(DECIMAL_2),
+        [DECIMAL_D1] = &&TARGET(DECIMAL_D1),
+        [DECIMAL_D2] = &&TARGET(DECIMAL_D2),
+        [LIST_E] = &&TARGET(LIST_E),
+        [LIST_1] = &&TARGET(LIST_1),
+        [LIST_2] = &&TARGET(LIST_2),
+        [LIST_D1] = &&TARGET(LIST_D1),
+        [LIST_D2] = &&TARGET(LIST_D2),
+        [TUPLE_E] = &&TARGET(TUPLE_E),
+        [TUPLE_1] = &&TARGET(TUPLE_1),
+        [TUPLE_2] = &&TARGET(TUPLE_2),
+        [TUPLE_D1] = &&TARGET(TUPLE_D1),
+        [TUPLE_D2] = &&TARGET(TUPLE_D2),
+        [SET_E] = &&TARGET(SET_E),
+        [SET_1] = &&TARGET(SET_1),
+        [SET_2] = &&TARGET(SET_2),
+        [SET_D1] = &&TARGET(SET_D1),
+        [SET_D2] = &&TARGET(SET_D2),
+        [FSET_E] = &&TARGET(FSET_E),
+        [FSET_1] = &&TARGET(FSET_1),
+        [FSET_2] = &&TARGET(FSET_2),
+        [FSET_D1] = &&TARGET(FSET_D1),
+        [FSET_D2] = &&TARGET(FSET_D2),
+        [DICT_E] = &&TARGET(DICT_E),
+        [DICT_1] = &&TARGET(DICT_1),
+        [DICT_2] = &&TARGET(DICT_2),
+        [DICT_D1] = &&TARGET(DICT_D1),
+        [DICT_D2] = &&TARGET(DICT_D2),
+        [RANGE_S] = &&TARGET(RANGE_S),
+        [NTUPLE_E] = &&TARGET(NTUPLE_E),
+        [NTUPLE_1] = &&TARGET(NTUPLE_1),
+        [NTUPLE_2] = &&TARGET(NTUPLE_2),
+        [NTUPLE_D1] = &&TARGET(NTUPLE_D1),
+        [NTUPLE_D2] = &&TARGET(NTUPLE_D2),
+        [DEQUE_E] = &&TARGET(DEQUE_E),
+        [DEQUE_1] = &&TARGET(DEQUE_1),
+        [DEQUE_2] = &&TARGET(DEQUE_2),
+        [DEQUE_D1] = &&TARGET(DEQUE_D1),
+        [DEQUE_D2] = &&TARGET(DEQUE_D2),
+        [COUNTER_E] = &&TARGET(COUNTER_E),
+        [COUNTER_1] = &&TARGET(COUNTER_1),
+        [COUNTER_2] = &&TARGET(COUNTER_2),
+        [COUNTER_D1] = &&TARGET(COUNTER_D1),
+        [COUNTER_D2] = &&TARGET(COUNTER_D2),
+        [ODICT_E] = &&TARGET(ODICT_E),
+        [ODICT_1] = &&TARGET(ODICT_1),
+        [ODICT_2] = &&TARGET(ODICT_2),
+        [ODICT_D1] = &&TARGET(ODICT_D1),
+        [ODICT_D2] = &&TARGET(ODICT_D2),
+        [CHAINMAP_E] = &&TARGET(CHAINMAP_E),
+        [CHAINMAP_1] = &&TARGET(CHAINMAP_1),
+        [CHAINMAP_2] = &&TARGET(CHAINMAP_2),
+        [CHAINMAP_D1] = &&TARGET(CHAINMAP_D1),
+        [CHAINMAP_D2] = &&TARGET(CHAINMAP_D2),
+        [PATH_E] = &&TARGET(PATH_E),
+        [PATH_1] = &&TARGET(PATH_1),
+        [PATH_2] = &&TARGET(PATH_2),
+        [PATH_D1] = &&TARGET(PATH_D1),
+        [PATH_D2] = &&TARGET(PATH_D2),
+        [PPATH_E] = &&TARGET(PPATH_E),
+        [PPATH_1] = &&TARGET(PPATH_1),
+        [PPATH_2] = &&TARGET(PPATH_2),
+        [PPATH_D1] = &&TARGET(PPATH_D1),
+        [PPATH_D2] = &&TARGET(PPATH_D2),
+        [PLIST_I] = &&TARGET(PLIST_I),
+        [PLIST_F] = &&TARGET(PLIST_F),
+        [PTUPLE_I] = &&TARGET(PTUPLE_I),
+        [PTUPLE_F] = &&TARGET(PTUPLE_F),
+    };
+#pragma GCC diagnostic pop
+
+    goto *dispatch_table[datachar];
+    {
+#else
     switch (datachar)
     {
-    case STR_E: return to_str_e(bd);
-    case STR_1: return to_str_gen(bd, 1);
-    case STR_2: return to_str_gen(bd, 2);
-    case STR_D1:
+#endif
+    TARGET(STR_E): return to_str_e(bd);
+    TARGET(STR_1): return to_str_gen(bd, 1);
+    TARGET(STR_2): return to_str_gen(bd, 2);
+    TARGET(STR_D1):
     {
         // Get the size bytes length for the dynamic 1 method
         size_t size_bytes_length = D1_length(bd);
@@ -2508,287 +3158,297 @@ static inline PyObject *to_any_value(ByteData *bd)
         // Call the generic function with the size bytes length
         return to_str_gen(bd, size_bytes_length);
     }
-    case STR_D2:
+    TARGET(STR_D2):
     {
         size_t size_bytes_length = D2_length(bd);
         if (size_bytes_length == 0) return NULL;
         return to_str_gen(bd, size_bytes_length);
     }
-    case INT_1: return to_int_gen(bd, 1);
-    case INT_2: return to_int_gen(bd, 2);
-    case INT_3: return to_int_gen(bd, 3);
-    case INT_4: return to_int_gen(bd, 4);
-    case INT_5: return to_int_gen(bd, 5);
-    case INT_D1:
+    TARGET(INT_1): return to_int_gen(bd, 1);
+    TARGET(INT_2): return to_int_gen(bd, 2);
+    TARGET(INT_3): return to_int_gen(bd, 3);
+    TARGET(INT_4): return to_int_gen(bd, 4);
+    TARGET(INT_5): return to_int_gen(bd, 5);
+    TARGET(INT_D1):
     {
         // The integers dynamic 1 method is a bit different with a single byte size, so do it directly
 
-        // Ensure the offset for the size byte
-        if (ensure_offset(bd, 1) == -1) return NULL;
+        // Ensure the offset for the datachar and the size byte
+        if (ensure_offset(bd, 2) == -1) return NULL;
         // Get the length of the item bytes
         size_t length = bytes_to_size_t(&(bd->bytes[++bd->offset]), 1);
         // Use and return the generic to_int method
         return to_int_gen(bd, length);
     }
-    case INT_D2:
+    TARGET(INT_D2):
     {
         // The size bytes length can be received using the dynamic 2 function, so use that
         size_t size_bytes_length = D2_length(bd);
         if (size_bytes_length == 0) return NULL;
         return to_int_gen(bd, size_bytes_length);
     }
-    case FLOAT_S:    return to_float_s(bd);
-    case BOOL_T:     return to_bool_gen(bd, Py_True);
-    case BOOL_F:     return to_bool_gen(bd, Py_False);
-    case COMPLEX_S:  return to_complex_s(bd);
-    case NONE_S:     return to_none_s(bd);
-    case ELLIPSIS_S: return to_ellipsis_s(bd);
-    case BYTES_E:    return to_bytes_e(bd, 0);
-    case BYTES_1:    return to_bytes_gen(bd, 1, 0);
-    case BYTES_2:    return to_bytes_gen(bd, 2, 0);
-    case BYTES_D1:
+    TARGET(BOOL_T):
+    TARGET(BOOL_F):
+    TARGET(NONE_S):
+    TARGET(ELLIPSIS_S): return to_singleton(bd, datachar);
+    TARGET(FLOAT_S):    return to_float_s(bd);
+    TARGET(COMPLEX_S):  return to_complex_s(bd);
+    TARGET(BYTES_E):    return to_bytes_e(bd, 0);
+    TARGET(BYTES_1):    return to_bytes_gen(bd, 1, 0);
+    TARGET(BYTES_2):    return to_bytes_gen(bd, 2, 0);
+    TARGET(BYTES_D1):
     {
         size_t size_bytes_length = D1_length(bd);
         if (size_bytes_length == 0) return NULL;
         return to_bytes_gen(bd, size_bytes_length, 0);
     }
-    case BYTES_D2:
+    TARGET(BYTES_D2):
     {
         size_t size_bytes_length = D2_length(bd);
         if (size_bytes_length == 0) return NULL;
         return to_bytes_gen(bd, size_bytes_length, 0);
     }
-    case BYTEARR_E: return to_bytes_e(bd, 1);
-    case BYTEARR_1: return to_bytes_gen(bd, 1, 1);
-    case BYTEARR_2: return to_bytes_gen(bd, 2, 1);
-    case BYTEARR_D1:
+    TARGET(BYTEARR_E): return to_bytes_e(bd, 1);
+    TARGET(BYTEARR_1): return to_bytes_gen(bd, 1, 1);
+    TARGET(BYTEARR_2): return to_bytes_gen(bd, 2, 1);
+    TARGET(BYTEARR_D1):
     {
         size_t size_bytes_length = D1_length(bd);
         if (size_bytes_length == 0) return NULL;
         return to_bytes_gen(bd, size_bytes_length, 1);
     }
-    case BYTEARR_D2:
+    TARGET(BYTEARR_D2):
     {
         size_t size_bytes_length = D2_length(bd);
         if (size_bytes_length == 0) return NULL;
         return to_bytes_gen(bd, size_bytes_length, 1);
     }
-    case DATETIME_DT: return to_datetime_gen(bd, datetime_dt);
-    case DATETIME_TD: return to_timedelta_s(bd);
-    case DATETIME_D:  return to_datetime_gen(bd, datetime_d); 
-    case DATETIME_T:  return to_datetime_gen(bd, datetime_t);
-    case UUID_S:      return to_uuid_s(bd);
-    case MEMVIEW_E:   return to_memoryview_e(bd);
-    case MEMVIEW_1:   return to_memoryview_gen(bd, 1);
-    case MEMVIEW_2:   return to_memoryview_gen(bd, 2);
-    case MEMVIEW_D1:
+    TARGET(DATETIME_DT): return to_datetime_gen(bd, datetime_dt);
+    TARGET(DATETIME_TD): return to_timedelta_s(bd);
+    TARGET(DATETIME_D):  return to_datetime_gen(bd, datetime_d); 
+    TARGET(DATETIME_T):  return to_datetime_gen(bd, datetime_t);
+    TARGET(UUID_S):      return to_uuid_s(bd);
+    TARGET(MEMVIEW_E):   return to_memoryview_e(bd);
+    TARGET(MEMVIEW_1):   return to_memoryview_gen(bd, 1);
+    TARGET(MEMVIEW_2):   return to_memoryview_gen(bd, 2);
+    TARGET(MEMVIEW_D1):
     {
         size_t size_bytes_length = D1_length(bd);
         if (size_bytes_length == 0) return NULL;
         return to_memoryview_gen(bd, size_bytes_length);
     }
-    case MEMVIEW_D2:
+    TARGET(MEMVIEW_D2):
     {
         size_t size_bytes_length = D2_length(bd);
         if (size_bytes_length == 0) return NULL;
         return to_memoryview_gen(bd, size_bytes_length);
     }
-    case DECIMAL_1: return to_decimal_gen(bd, 1);
-    case DECIMAL_2: return to_decimal_gen(bd, 2);
-    case DECIMAL_D1:
+    TARGET(DECIMAL_1): return to_decimal_gen(bd, 1);
+    TARGET(DECIMAL_2): return to_decimal_gen(bd, 2);
+    TARGET(DECIMAL_D1):
     {
         size_t size_bytes_length = D1_length(bd);
         if (size_bytes_length == 0) return NULL;
         return to_decimal_gen(bd, size_bytes_length);
     }
-    case DECIMAL_D2:
+    TARGET(DECIMAL_D2):
     {
         size_t size_bytes_length = D2_length(bd);
         if (size_bytes_length == 0) return NULL;
         return to_decimal_gen(bd, size_bytes_length);
     }
-    case LIST_E: return to_list_e(bd);
-    case LIST_1: return to_list_gen(bd, 1);
-    case LIST_2: return to_list_gen(bd, 2);
-    case LIST_D1:
+    TARGET(LIST_E): return to_list_e(bd);
+    TARGET(LIST_1): return to_list_gen(bd, 1);
+    TARGET(LIST_2): return to_list_gen(bd, 2);
+    TARGET(LIST_D1):
     {
         size_t size_bytes_length = D1_length(bd);
         if (size_bytes_length == 0) return NULL;
         return to_list_gen(bd, size_bytes_length);
     }
-    case LIST_D2:
+    TARGET(LIST_D2):
     {
         size_t size_bytes_length = D2_length(bd);
         if (size_bytes_length == 0) return NULL;
         return to_list_gen(bd, size_bytes_length);
     }
-    case TUPLE_E: return to_tuple_e(bd);
-    case TUPLE_1: return to_tuple_gen(bd, 1);
-    case TUPLE_2: return to_tuple_gen(bd, 2);
-    case TUPLE_D1:
+    TARGET(TUPLE_E): return to_tuple_e(bd);
+    TARGET(TUPLE_1): return to_tuple_gen(bd, 1);
+    TARGET(TUPLE_2): return to_tuple_gen(bd, 2);
+    TARGET(TUPLE_D1):
     {
         size_t size_bytes_length = D1_length(bd);
         if (size_bytes_length == 0) return NULL;
         return to_tuple_gen(bd, size_bytes_length);
     }
-    case TUPLE_D2:
+    TARGET(TUPLE_D2):
     {
         size_t size_bytes_length = D2_length(bd);
         if (size_bytes_length == 0) return NULL;
         return to_tuple_gen(bd, size_bytes_length);
     }
-    case SET_E: return to_iterable_e(bd, SET_E);
-    case SET_1: return to_iterable_gen(bd, 1, SET_E);
-    case SET_2: return to_iterable_gen(bd, 2, SET_E);
-    case SET_D1:
+    TARGET(SET_E): return to_iterable_e(bd, SET_E);
+    TARGET(SET_1): return to_iterable_gen(bd, 1, SET_E);
+    TARGET(SET_2): return to_iterable_gen(bd, 2, SET_E);
+    TARGET(SET_D1):
     {
         size_t size_bytes_length = D1_length(bd);
         if (size_bytes_length == 0) return NULL;
         return to_iterable_gen(bd, size_bytes_length, SET_E);
     }
-    case SET_D2:
+    TARGET(SET_D2):
     {
         size_t size_bytes_length = D2_length(bd);
         if (size_bytes_length == 0) return NULL;
         return to_iterable_gen(bd, size_bytes_length, SET_E);
     }
-    case FSET_E: return to_iterable_e(bd, FSET_E);
-    case FSET_1: return to_iterable_gen(bd, 1, FSET_E);
-    case FSET_2: return to_iterable_gen(bd, 2, FSET_E);
-    case FSET_D1:
+    TARGET(FSET_E): return to_iterable_e(bd, FSET_E);
+    TARGET(FSET_1): return to_iterable_gen(bd, 1, FSET_E);
+    TARGET(FSET_2): return to_iterable_gen(bd, 2, FSET_E);
+    TARGET(FSET_D1):
     {
         size_t size_bytes_length = D1_length(bd);
         if (size_bytes_length == 0) return NULL;
         return to_iterable_gen(bd, size_bytes_length, FSET_E);
     }
-    case FSET_D2:
+    TARGET(FSET_D2):
     {
         size_t size_bytes_length = D2_length(bd);
         if (size_bytes_length == 0) return NULL;
         return to_iterable_gen(bd, size_bytes_length, FSET_E);
     }
-    case DICT_E: return to_dict_e(bd);
-    case DICT_1: return to_dict_gen(bd, 1);
-    case DICT_2: return to_dict_gen(bd, 2);
-    case DICT_D1:
+    TARGET(DICT_E): return to_dict_e(bd);
+    TARGET(DICT_1): return to_dict_gen(bd, 1);
+    TARGET(DICT_2): return to_dict_gen(bd, 2);
+    TARGET(DICT_D1):
     {
         size_t size_bytes_length = D1_length(bd);
         if (size_bytes_length == 0) return NULL;
         return to_dict_gen(bd, size_bytes_length);
     }
-    case DICT_D2:
+    TARGET(DICT_D2):
     {
         size_t size_bytes_length = D2_length(bd);
         if (size_bytes_length == 0) return NULL;
         return to_dict_gen(bd, size_bytes_length);
     }
-    case RANGE_S: return to_range_s(bd);
-    case NTUPLE_E: return to_namedtuple_e(bd);
-    case NTUPLE_1: return to_namedtuple_gen(bd, 1);
-    case NTUPLE_2: return to_namedtuple_gen(bd, 2);
-    case NTUPLE_D1:
+    TARGET(RANGE_S): return to_range_s(bd);
+    TARGET(NTUPLE_E): return to_namedtuple_e(bd);
+    TARGET(NTUPLE_1): return to_namedtuple_gen(bd, 1);
+    TARGET(NTUPLE_2): return to_namedtuple_gen(bd, 2);
+    TARGET(NTUPLE_D1):
     {
         size_t size_bytes_length = D1_length(bd);
         if (size_bytes_length == 0) return NULL;
         return to_namedtuple_gen(bd, size_bytes_length);
     }
-    case NTUPLE_D2:
+    TARGET(NTUPLE_D2):
     {
         size_t size_bytes_length = D2_length(bd);
         if (size_bytes_length == 0) return NULL;
         return to_namedtuple_gen(bd, size_bytes_length);
     }
-    case DEQUE_E: return to_iterable_e(bd, DEQUE_E);
-    case DEQUE_1: return to_iterable_gen(bd, 1, DEQUE_E);
-    case DEQUE_2: return to_iterable_gen(bd, 2, DEQUE_E);
-    case DEQUE_D1:
+    TARGET(DEQUE_E): return to_iterable_e(bd, DEQUE_E);
+    TARGET(DEQUE_1): return to_iterable_gen(bd, 1, DEQUE_E);
+    TARGET(DEQUE_2): return to_iterable_gen(bd, 2, DEQUE_E);
+    TARGET(DEQUE_D1):
     {
         size_t size_bytes_length = D1_length(bd);
         if (size_bytes_length == 0) return NULL;
         return to_iterable_gen(bd, size_bytes_length, DEQUE_E);
     }
-    case DEQUE_D2:
+    TARGET(DEQUE_D2):
     {
         size_t size_bytes_length = D2_length(bd);
         if (size_bytes_length == 0) return NULL;
         return to_iterable_gen(bd, size_bytes_length, DEQUE_E);
     }
-    case COUNTER_E: return to_counter_e(bd);
-    case COUNTER_1: return to_counter_gen(bd, 1);
-    case COUNTER_2: return to_counter_gen(bd, 2);
-    case COUNTER_D1:
+    TARGET(COUNTER_E): return to_counter_e(bd);
+    TARGET(COUNTER_1): return to_counter_gen(bd, 1);
+    TARGET(COUNTER_2): return to_counter_gen(bd, 2);
+    TARGET(COUNTER_D1):
     {
         size_t size_bytes_length = D1_length(bd);
         if (size_bytes_length == 0) return NULL;
         return to_counter_gen(bd, size_bytes_length);
     }
-    case COUNTER_D2:
+    TARGET(COUNTER_D2):
     {
         size_t size_bytes_length = D2_length(bd);
         if (size_bytes_length == 0) return NULL;
         return to_counter_gen(bd, size_bytes_length);
     }
-    case ODICT_E: return to_ordereddict_e(bd);
-    case ODICT_1: return to_ordereddict_gen(bd, 1);
-    case ODICT_2: return to_ordereddict_gen(bd, 2);
-    case ODICT_D1:
+    TARGET(ODICT_E): return to_ordereddict_e(bd);
+    TARGET(ODICT_1): return to_ordereddict_gen(bd, 1);
+    TARGET(ODICT_2): return to_ordereddict_gen(bd, 2);
+    TARGET(ODICT_D1):
     {
         size_t size_bytes_length = D1_length(bd);
         if (size_bytes_length == 0) return NULL;
         return to_ordereddict_gen(bd, size_bytes_length);
     }
-    case ODICT_D2:
+    TARGET(ODICT_D2):
     {
         size_t size_bytes_length = D2_length(bd);
         if (size_bytes_length == 0) return NULL;
         return to_ordereddict_gen(bd, size_bytes_length);
     }
-    case CHAINMAP_E: return to_chainmap_e(bd);
-    case CHAINMAP_1: return to_chainmap_gen(bd, 1);
-    case CHAINMAP_2: return to_chainmap_gen(bd, 2);
-    case CHAINMAP_D1:
+    TARGET(CHAINMAP_E): return to_chainmap_e(bd);
+    TARGET(CHAINMAP_1): return to_chainmap_gen(bd, 1);
+    TARGET(CHAINMAP_2): return to_chainmap_gen(bd, 2);
+    TARGET(CHAINMAP_D1):
     {
         size_t size_bytes_length = D1_length(bd);
         if (size_bytes_length == 0) return NULL;
         return to_chainmap_gen(bd, size_bytes_length);
     }
-    case CHAINMAP_D2:
+    TARGET(CHAINMAP_D2):
     {
         size_t size_bytes_length = D2_length(bd);
         if (size_bytes_length == 0) return NULL;
         return to_chainmap_gen(bd, size_bytes_length);
     }
-    case PATH_E: return to_path_e(bd, path_cl);
-    case PATH_1: return to_path_gen(bd, 1, path_cl);
-    case PATH_2: return to_path_gen(bd, 1, path_cl);
-    case PATH_D1:
+    TARGET(PATH_E): return to_path_e(bd, path_cl);
+    TARGET(PATH_1): return to_path_gen(bd, 1, path_cl);
+    TARGET(PATH_2): return to_path_gen(bd, 2, path_cl);
+    TARGET(PATH_D1):
     {
         size_t size_bytes_length = D1_length(bd);
         if (size_bytes_length == 0) return NULL;
         return to_path_gen(bd, size_bytes_length, path_cl);
     }
-    case PATH_D2:
+    TARGET(PATH_D2):
     {
         size_t size_bytes_length = D2_length(bd);
         if (size_bytes_length == 0) return NULL;
         return to_path_gen(bd, size_bytes_length, path_cl);
     }
-    case PPATH_E: return to_path_e(bd, purepath_cl);
-    case PPATH_1: return to_path_gen(bd, 1, purepath_cl);
-    case PPATH_2: return to_path_gen(bd, 1, purepath_cl);
-    case PPATH_D1:
+    TARGET(PPATH_E): return to_path_e(bd, purepath_cl);
+    TARGET(PPATH_1): return to_path_gen(bd, 1, purepath_cl);
+    TARGET(PPATH_2): return to_path_gen(bd, 2, purepath_cl);
+    TARGET(PPATH_D1):
     {
         size_t size_bytes_length = D1_length(bd);
         if (size_bytes_length == 0) return NULL;
         return to_path_gen(bd, size_bytes_length, purepath_cl);
     }
-    case PPATH_D2:
+    TARGET(PPATH_D2):
     {
         size_t size_bytes_length = D2_length(bd);
         if (size_bytes_length == 0) return NULL;
         return to_path_gen(bd, size_bytes_length, purepath_cl);
     }
-    default:
+    TARGET(PLIST_I):
+    TARGET(PLIST_F):
+    TARGET(PTUPLE_I):
+    TARGET(PTUPLE_F):
+    {
+        // The packed values always use the dynamic 1 method
+        size_t size_bytes_length = D1_length(bd);
+        if (size_bytes_length == 0) return NULL;
+        return to_packed_gen(bd, size_bytes_length, datachar == PLIST_F || datachar == PTUPLE_F, datachar >= PTUPLE_I);
+    }
+    TARGET_DEFAULT:
     {
         // Invalid datachar received
         PyErr_Format(PyExc_ValueError, "Likely received an invalid bytes object: fetched an invalid datatype representative. (Rep. code: %i)", (int)datachar);
@@ -2799,10 +3459,14 @@ static inline PyObject *to_any_value(ByteData *bd)
 
 // # The main to-value conversion function
 
-PyObject *to_value(PyObject *py_bytes)
+PyObject *to_value_buffer(const unsigned char *bytes, size_t length)
 {
-    // Get the PyBytes object as a C string
-    const unsigned char *bytes = (const unsigned char *)PyBytes_AsString(py_bytes);
+    // Check whether there's at least the protocol marker
+    if (length == 0)
+    {
+        PyErr_SetString(PyExc_ValueError, "Likely received an invalid bytes object: the bytes object is empty.");
+        return NULL;
+    }
 
     // Get the first character, being the protocol marker
     const unsigned char protocol = *bytes;
@@ -2810,41 +3474,30 @@ PyObject *to_value(PyObject *py_bytes)
     // Decide what to do based on the protocol version
     switch (protocol)
     {
-    case PROT_D: // The default SBS protocol
+    case PROT_2: // The default SBS protocol
+    case PROT_3: // Protocol 2 with the packed values added
     {
-        // Get the length of this bytes object for memory allocation
-        Py_ssize_t bytes_length = PyBytes_Size(py_bytes);
-
-        // Create the bytedata struct
-        ByteData *bd = (ByteData *)malloc(sizeof(ByteData));
-        if (bd == NULL)
-        {
-            PyErr_SetString(PyExc_MemoryError, "No available memory space.");
-            return NULL;
-        }
-
-        // Allocate the space for the bytes object
-        bd->bytes = (unsigned char *)malloc((size_t)bytes_length);
-        if (bd->bytes == NULL)
-        {
-            free(bd);
-            PyErr_SetString(PyExc_MemoryError, "No available memory space.");
-            return NULL;
-        }
-
-        // Write the bytes and offset to the bytedata
-        memcpy((unsigned char *)(bd->bytes), bytes, (size_t)bytes_length);
-        bd->offset = 1; // Start at offset 1 to exclude the prototype marker
-        bd->max_offset = (size_t)bytes_length; // Set the max offset to the bytes length
+        // Create the bytedata struct, which reads directly from the given bytes
+        ByteData bd = {
+            1,      // Start at offset 1 to exclude the prototype marker
+            length, // Set the max offset to the bytes length
+            bytes
+        };
 
         // Use and return the to-any-value conversion function
-        PyObject *result = to_any_value(bd);
-        free((void *)(bd->bytes));
-        free(bd);
+        return to_any_value(&bd);
+    }
+    case PROT_1:
+    {
+        // The older protocols expect a bytes object
+        PyObject *py_bytes = PyBytes_FromStringAndSize((const char *)bytes, (Py_ssize_t)length);
+        if (py_bytes == NULL) return NULL;
+
+        PyObject *result = to_value_prot1(py_bytes);
+        Py_DECREF(py_bytes);
 
         return result;
     }
-    case PROT_1: return to_value_prot1(py_bytes);
     default: // Likely received an invalid bytes object
     {
         PyErr_Format(PyExc_ValueError, "Likely received an invalid bytes object: invalid protocol marker.");
@@ -2853,3 +3506,59 @@ PyObject *to_value(PyObject *py_bytes)
     }
 }
 
+PyObject *to_values_buffer(const unsigned char *bytes, size_t length)
+{
+    // Only protocol 2 and 3 are supported for multiple values
+    if (length == 0 || (*bytes != PROT_2 && *bytes != PROT_3))
+    {
+        PyErr_SetString(PyExc_ValueError, "Likely received an invalid bytes object: invalid protocol marker.");
+        return NULL;
+    }
+
+    // The list that will hold the values
+    PyObject *list = PyList_New(0);
+    if (list == NULL) return NULL;
+
+    // Create the bytedata struct, which reads directly from the given bytes
+    ByteData bd = {
+        0,      // Start at the first protocol marker
+        length, // Set the max offset to the bytes length
+        bytes
+    };
+
+    while (bd.offset < bd.max_offset)
+    {
+        /*
+          Skip over the protocol markers. The values start with a datachar, which
+          is never the same as a protocol marker, so these can only be the markers
+          of the bytes objects that were concatenated.
+        */
+        if (bytes[bd.offset] == PROT_2 || bytes[bd.offset] == PROT_3)
+        {
+            bd.offset++;
+            continue;
+        }
+
+        PyObject *value = to_any_value(&bd);
+        if (value == NULL || PyList_Append(list, value) == -1)
+        {
+            Py_XDECREF(value);
+            Py_DECREF(list);
+            return NULL; // Error already set
+        }
+
+        Py_DECREF(value);
+    }
+
+    return list;
+}
+
+PyObject *to_value(PyObject *py_bytes)
+{
+    // Get the PyBytes object as a C string
+    const unsigned char *bytes = (const unsigned char *)PyBytes_AsString(py_bytes);
+    if (bytes == NULL) return NULL;
+
+    // Convert the bytes directly, without copying them first
+    return to_value_buffer(bytes, (size_t)PyBytes_Size(py_bytes));
+}
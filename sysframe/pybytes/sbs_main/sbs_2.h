@@ -9,25 +9,41 @@
 #include <datetime.h>
 #include <ctype.h>
 
+// Hide the symbols shared between the source files from the module's symbol table,
+// so that they're called directly instead of through the PLT
+#if defined(__GNUC__) || defined(__clang__)
+#define SBS_HIDDEN __attribute__((visibility("hidden")))
+#else
+#define SBS_HIDDEN
+#endif
+
 // Datetime module classes
-extern PyObject *datetime_dt; // datetime
-extern PyObject *datetime_d;  // date
-extern PyObject *datetime_t;  // time
+extern SBS_HIDDEN PyObject *datetime_dt; // datetime
+extern SBS_HIDDEN PyObject *datetime_d;  // date
+extern SBS_HIDDEN PyObject *datetime_t;  // time
 // UUID module class
-extern PyObject *uuid_cl;
+extern SBS_HIDDEN PyObject *uuid_cl;
 // Decimal module class
-extern PyObject *decimal_cl;
+extern SBS_HIDDEN PyObject *decimal_cl;
 // Namedtuple module class
-extern PyObject *namedtuple_cl;
+extern SBS_HIDDEN PyObject *namedtuple_cl;
 
 // Initialize the SBS module
-int sbs2_init(void);
+SBS_HIDDEN int sbs2_init(void);
 // Cleanup the SBS module
-void sbs2_cleanup(void);
+SBS_HIDDEN void sbs2_cleanup(void);
 
 // Convert a value to bytes
-PyObject *from_value(PyObject *value);
+SBS_HIDDEN PyObject *from_value(PyObject *value);
+// Convert a value to bytes written into a bytearray, returns the number of bytes written
+SBS_HIDDEN Py_ssize_t from_value_into(PyObject *bytearray, PyObject *value);
+// Convert the items of an iterable to bytes, placed directly after each other
+SBS_HIDDEN PyObject *from_values(PyObject *iterable);
 // Convert a bytes object to the value it used to be
-PyObject *to_value(PyObject *bytes);
+SBS_HIDDEN PyObject *to_value(PyObject *bytes);
+// Convert a C bytes buffer to the value it used to be
+SBS_HIDDEN PyObject *to_value_buffer(const unsigned char *bytes, size_t length);
+// Convert a C bytes buffer with values placed after each other to a list of the values
+SBS_HIDDEN PyObject *to_values_buffer(const unsigned char *bytes, size_t length);
 
 #endif // SBS_2_H
\ No newline at end of file
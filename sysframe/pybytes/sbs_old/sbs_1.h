@@ -6,10 +6,13 @@
 #include <datetime.h>
 #include <ctype.h>
 
+// Shares the symbol visibility definition with the current protocol
+#include "sbs_main/sbs_2.h"
+
 // The init function
-void sbs1_init(void);
+SBS_HIDDEN void sbs1_init(void);
 
 // The to-conversion function
-PyObject *to_value_prot1(PyObject *py_bytes);
+SBS_HIDDEN PyObject *to_value_prot1(PyObject *py_bytes);
 
 #endif // CONVERSIONS_1_H
\ No newline at end of file
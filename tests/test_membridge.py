@@ -1,31 +1,99 @@
-# Use the test values from `test_pybytes`
-from test_pybytes import test_values
-from sysframe import membridge
+from unittest import TestCase, main
+from sysframe import membridge, pybytes
+
+# Use the shared test values
+from tests._fixtures import test_values, test_values_large
+import subprocess
+import sys
+import os
+
+# Include the large test values when `SYSFRAME_SLOW` is set
+test_values = test_values + (test_values_large if os.environ.get('SYSFRAME_SLOW') else [])
 
 # The shared memory name
 name = '/test-python-membridge-123'
 
-# Create the shared memory
-membridge.create_memory(name)
+# The environment for running code in another process, which has to find the `sysframe` package
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [root, os.environ.get('PYTHONPATH')])))
+
+
+# Helper function to run code in another process
+def run_process(code, timeout=60):
+    return subprocess.run([sys.executable, '-c', code], env=env, timeout=timeout, check=True)
+
+
+class TestMembridge(TestCase):
+    def setUp(self):
+        # Create the shared memory
+        membridge.create_memory(name)
+
+    def tearDown(self):
+        # Close the shared memory
+        membridge.remove_memory(name)
+
+    def test_values(self):
+        # Write all test values at once and read them back
+        self.assertTrue(membridge.write_memory(name, pybytes.from_values(test_values)))
+        self.assertEqual(test_values, pybytes.to_values(membridge.read_memory(name)))
+
+    def test_page_value(self):
+        # Write and read a value of a single page size, where shared memory is the quickest
+        page_value = b'\x00' * 4096
+        membridge.write_memory(name, page_value)
+        self.assertEqual(page_value, membridge.read_memory(name))
+
+    def test_smaller_value(self):
+        # Write a small value after a large one, of which only the small value should be read back
+        membridge.write_memory(name, b'\x01' * (1024 * 1024))
+        membridge.write_memory(name, 42)
+        self.assertEqual(42, membridge.read_memory(name))
+
+    def test_mapped_memory(self):
+        # Map the shared memory once, with enough space for the largest test value
+        buffer = membridge.map_memory(name, 8 * 1024 * 1024)
+
+        # Go over the test values and write/read them through the mapped memory
+        for index, value in enumerate(test_values):
+            with self.subTest(index=index):
+                membridge.write_into(buffer, value)
+                self.assertEqual(value, membridge.read_from(buffer))
+
+        # Release the mapped memory
+        buffer.release()
+
+    def test_removed_by_other_process(self):
+        # Read the value once so that this process has the memory mapped
+        membridge.write_memory(name, 'old')
+        self.assertEqual('old', membridge.read_memory(name))
+
+        # Have another process replace the memory under the same name
+        run_process(f'from sysframe import membridge; membridge.remove_memory({name!r}); membridge.write_memory({name!r}, "new")')
+        self.assertEqual('new', membridge.read_memory(name))
+
+    def test_threads(self):
+        # Read and write from multiple threads, with values that run Python code when converted
+        run_process(f'''if True:
+            from sysframe import membridge
+            from pathlib import Path
+            import threading
 
-# Number of errors
-errors = 0
+            value = [Path('/home/usr/Documents')] * 20000
+            membridge.write_memory({name!r}, value)
 
-# Go over the test values and read/write them
-for value in test_values:
-    write = membridge.write_memory(name, value)
-    result = membridge.read_memory(name)
-    
-    if write == False: # Check if we couldn,t write
-        print(f'Failed to write value {value}')
-        errors += 1
-    elif result == False and value is not False: # Check if we couldn't read
-        print(f'Failed to read value {value}')
-        errors += 1
+            stop = False
+            def write():
+                while not stop:
+                    membridge.write_memory({name!r}, value)
 
-# Close the shared memory
-membridge.remove_memory(name)
+            thread = threading.Thread(target=write)
+            thread.start()
+            for _ in range(20):
+                assert membridge.read_memory({name!r}) == value
 
-# Print if there were no errors, or how many there were
-print(errors == 0 and 'No errors' or f'{errors} errors')
+            stop = True
+            thread.join()
+        ''')
 
+if __name__ == '__main__':
+    main()
@@ -1,130 +1,153 @@
-from unittest import TestCase, main
+from unittest import TestCase, main, skipUnless
 from sysframe import pybytes
 
-from collections import *
+# Use the shared test values
+from tests._fixtures import test_values, test_values_large
+from collections import namedtuple
 from pathlib import Path, PurePath
-import datetime
-import decimal
-import uuid
-
-
-# A list with all values to test
-test_values = [
-    # Str
-    'Hello, world!',
-    '',
-    'Hello, world!' * 100000,
-    '\t\n!@#$%^&*()~`_+-=[]{}|",./<>?' * 100000,
-    # Int
-    12345,
-    10**1000,
-    -(10**1000),
-    # Float
-    3.142,
-    # Bool
-    True,
-    False,
-    # NoneType
-    None,
-    # Complex
-    2j + 3,
-    0.000001j - 9999999,
-    # Ellipsis
-    ...,
-    # Bytes
-    b'Hello, world!',
-    b'',
-    b'Hello, world!' * 100000,
-    b'\t\n!@#$%^&*()~`_+-=[]{}|",./<>?' * 100000,
-    # Bytearray
-    bytearray(b'Hello, world!'),
-    bytearray(b''),
-    bytearray(b'Hello, world!' * 100000),
-    bytearray(b'\t\n!@#$%^&*()~`_+-=[]{}|",./<>?' * 100000),
-    # Datetime
-    datetime.datetime(2008, 6, 8, 23, 53),
-    datetime.datetime(9999, 12, 31, 23, 59, 59, 999),
-    datetime.timedelta(5, 14, 12, 11, 43, 19, 2),
-    datetime.timedelta(6, 59, 999, 999, 59, 23, 51),
-    datetime.date(2008, 6, 8),
-    datetime.date(9999, 12, 31),
-    datetime.time(23, 53),
-    datetime.time(23, 59, 59, 999),
-    # Decimal
-    decimal.Decimal('3.1415926'),
-    decimal.Decimal('3.1415926535897932384626433832795028841971693993751058209749445923078164062862089986280348253421170679'),
-    # UUID
-    uuid.uuid1(),
-    uuid.uuid4(),
-    # Memoryview
-    memoryview(b'Hello, world!'),
-    memoryview(b'Hello, world!' * 100000),
-    memoryview(b'\t\n!@#$%^&*()~`_+-=[]{}|",./<>?' * 100000),
-    # Range
-    range(0, 100, 2),
-    range(-1000000000000, 1000000000000, 1000000000),
-    # Namedtuple
-    namedtuple('awesome_namedtuple', ['some', 'interesting', 'values'])('with', 'interesting', 'items'),
-    namedtuple('_', [])(),
-    namedtuple('hello', ['world'])(namedtuple('banana', ['woah'])('some_value')),
-    # Deque
-    deque([1, 2, 3, 4, 5]),
-    deque([]),
-    deque([deque([1, 2, 3, deque([4, 5, 6])])]),
-    # Counter
-    Counter('abcdeabcdabcaba'),
-    Counter(),
-    # OrderedDict
-    OrderedDict({'Hello': 'world!', 'some': 'key', 'value': 'pairs'}),
-    OrderedDict(),
-    OrderedDict(OrderedDict(OrderedDict(OrderedDict(OrderedDict(OrderedDict(OrderedDict())))))),
-    # ChainMap
-    ChainMap({'a': 2, 'b': 3}, {'b': 1, 'c': 4}),
-    ChainMap(ChainMap({'a': 2, 'b': 3}, {'b': 1, 'c': 4}), ChainMap({'a': 2, 'b': 3}, {'b': 1, 'c': 4})),
-    # List
-    [3.142, None, 'Hello, world!'],
-    [],
-    [[[[['Hello,', [[[]]], 'world!']]]]],
-    # Dict
-    {3.142: 'Hello, world!', True: False},
-    dict(),
-    {'Hello,': {'world!': {'This': {'is': {'deeply': {'nested!': {}}}}}}},
-    # Tuple
-    (9009, 'banananana'),
-    tuple(),
-    (((((((('All those commas...',),),),),),),),),
-    # Set
-    {'What is your favorite music genre?'},
-    set(),
-    # Frozenset
-    frozenset([3.142, None, 'Hello, world!']),
-    frozenset(),
-    # Path
-    Path(),
-    Path('/home/usr2/Pictures'),
-    # PurePath
-    PurePath(),
-    PurePath('/home/usr2/Downloads'),
-]
+import os
+
+
+# Scratch buffer that is reused for encoding the test values
+_scratch = bytearray(1 << 20)
 
 
 class TestPybytes(TestCase):
     # Helper function to test encoding/decoding
     def assertFromTo(self, value):
-        try:
-            bytes_obj = pybytes.from_value(value)
-            decoded = pybytes.to_value(bytes_obj)
-            self.assertEqual(value, decoded, f"Failed for value: {value}")
-        except:
-            self.fail(f"Error with value: {value}")
+        size = pybytes.from_value_into(_scratch, value)
+        decoded = pybytes.to_value(memoryview(_scratch)[:size])
+        self.assertEqual(value, decoded, f"Failed for value: {value}")
     
     def test_values(self):
-        # Test each value separately
-        for value in test_values:
-            self.assertFromTo(value)
+        # Test all values in a single round-trip, which also covers the nested conversions
+        encoded = pybytes.from_value(test_values)
+        decoded = pybytes.to_value(encoded)
+        self.assertEqual(test_values, decoded)
+    
+    def test_singleton_bulk(self):
+        # Test a large amount of singletons, which share a single decoding path
+        self.assertFromTo([None, True, False, ...] * 2500)
+    
+    def test_bytes_like(self):
+        # Test converting back from other bytes-like objects
+        value = [3.142, None, 'Hello, world!']
+        bytes_obj = pybytes.from_value(value)
+        self.assertEqual(value, pybytes.to_value(bytearray(bytes_obj)))
+        self.assertEqual(value, pybytes.to_value(memoryview(bytes_obj)))
+    
+    def test_values_many(self):
+        # Test converting multiple values at once, including concatenated bytes objects
+        values = [3.142, None, 'Hello, world!', [1, 2, 3], {'a': b'b'}]
+        bytes_obj = pybytes.from_values(values)
+        self.assertEqual(values, pybytes.to_values(bytes_obj))
+        self.assertEqual(values * 2, pybytes.to_values(bytes_obj + pybytes.from_values(iter(values))))
+        self.assertEqual([], pybytes.to_values(pybytes.from_values([])))
+    
+    def test_homog_list_int(self):
+        # Test lists and tuples of which all items are ints, which are written packed
+        ints = list(range(-100, 100)) + [2**63 - 1, -2**63]
+        self.assertFromTo(ints)
+        self.assertFromTo(tuple(ints))
+        self.assertFromTo([ints, tuple(ints), {'ints': ints}])
+        
+        # And the ones that have to fall back on the regular conversion
+        self.assertFromTo(list(range(100)) + [2**63])
+        self.assertFromTo(list(range(100)) + [True])
+        self.assertFromTo(tuple(range(7)))
+
+        # The packed ints are written little-endian on every system
+        ints = [-2**63, -1, 0, 1, 256, 2**32, 2**63 - 1, 42]
+        self.assertTrue(pybytes.from_value(ints).endswith(b''.join(i.to_bytes(8, 'little', signed=True) for i in ints)))
+
+    def test_protocol(self):
+        # Test that protocol 3 is only written for packed values, so that older readers can read the other bytes
+        values = ['Hello, world!', [1, 2, 3], {'a': b'b'}]
+        packed = [values, list(range(8))]
+        self.assertEqual(0xfd, pybytes.from_value(values)[0])
+        self.assertEqual(0xfd, pybytes.from_values(values)[0])
+        self.assertEqual(0xfc, pybytes.from_value(packed)[0])
+        self.assertEqual(0xfc, pybytes.from_values(packed)[0])
+        
+        pybytes.from_value_into(_scratch, packed)
+        self.assertEqual(0xfc, _scratch[0])
+        pybytes.from_value_into(_scratch, values)
+        self.assertEqual(0xfd, _scratch[0])
+        
+        # Both protocols can be converted back, also when concatenated
+        self.assertEqual(packed + values, pybytes.to_values(pybytes.from_values(packed) + pybytes.from_values(values)))
+    
+    def test_homog_list_float(self):
+        # Test lists and tuples of which all items are floats, which are written packed
+        floats = [i / 7 for i in range(-100, 100)] + [-0.0, float('inf'), float('-inf'), 1e308, 5e-324]
+        self.assertFromTo(floats)
+        self.assertFromTo(tuple(floats))
+        self.assertFromTo([floats, tuple(floats), {'floats': floats}])
         
-        # Test the whole list with testing values as well
-        self.assertFromTo(test_values)
+        # And a mix of ints and floats, which falls back on the regular conversion
+        self.assertFromTo(floats + [1])
+    
+    def test_bytes_with_embedded_special_bytes(self):
+        # Test payloads that contain every byte value, including the datachar and protocol values
+        all_bytes = bytes(range(256)) * 64
+        self.assertFromTo([all_bytes, bytearray(all_bytes), memoryview(all_bytes)])
+        
+        # And strings with multi-byte characters between ASCII runs
+        self.assertFromTo(['abc\x00\xfd\xfe\xff' * 512, 'Hello, \u4e16\u754c! \U0001f600' * 512])
+
+    def test_namedtuple_many(self):
+        # Test more distinct namedtuple types than are cached, which are still converted back when the cache is full
+        values = [namedtuple(f'nt_{i}', ['a', f'b_{i}'])(i, str(i)) for i in range(300)]
+        for _ in range(2):
+            decoded = pybytes.to_value(pybytes.from_value(values))
+            self.assertEqual(values, decoded)
+            self.assertEqual([value._fields for value in values], [value._fields for value in decoded])
+
+    def test_from_value_into_self(self):
+        # Test writing values into a bytearray that they hold themselves
+        for data in (b'abc', bytes(range(256)) * 1024):
+            for make_value in (lambda buffer: buffer, lambda buffer: [buffer, b'x' * 100000, buffer]):
+                buffer = bytearray(data)
+                value = make_value(buffer)
+                expected = pybytes.to_value(pybytes.from_value(make_value(bytearray(data))))
+
+                size = pybytes.from_value_into(buffer, value)
+                self.assertEqual(expected, pybytes.to_value(bytes(buffer[:size])))
+
+            # And a memoryview of it, which locks the size of the bytearray so it's padded to fit the bytes
+            buffer = bytearray(2) + data + bytearray(16)
+            with memoryview(buffer) as view:
+                size = pybytes.from_value_into(buffer, view[2:2 + len(data)])
+            self.assertEqual(data, bytes(pybytes.to_value(bytes(buffer[:size]))))
+
+    def test_invalid_bytes(self):
+        # Test that truncated and malformed bytes objects raise an error instead of reading past the end
+        encoded = pybytes.from_value(test_values)
+        for size in range(len(encoded)):
+            with self.assertRaises(ValueError):
+                pybytes.to_value(encoded[:size])
+
+        for value in (b'\xfd\x03', b'\xfd\x04\x01', b'\xfd,\x01d.b', b'\xfd\x7f\xff\xff'):
+            with self.assertRaises(ValueError):
+                pybytes.to_value(value)
+
+    def test_empty_and_long_items(self):
+        # Test empty items in between others, and paths that need two size bytes
+        self.assertFromTo([memoryview(b''), 1, b'', bytearray(), 'a'])
+        self.assertEqual([bytes, bytearray], [type(item) for item in pybytes.to_value(pybytes.from_value([b'', bytearray()]))])
+        self.assertFromTo([Path('a' * 300), PurePath('b/' * 200), Path('c')])
+
+
+@skipUnless(os.environ.get('SYSFRAME_SLOW'), 'set SYSFRAME_SLOW=1 to run')
+class TestPybytesLarge(TestCase):
+    # Use the same helper function as the regular tests
+    assertFromTo = TestPybytes.assertFromTo
+    
+    def test_values_large(self):
+        # Test each large value separately, continuing with the others when one fails
+        for index, value in enumerate(test_values_large):
+            with self.subTest(index=index):
+                self.assertFromTo(value)
 
 if __name__ == '__main__':
     main()